@@ -1,8 +1,24 @@
 """botplotlib — Beautiful plots, simple API, no matplotlib."""
 
-from botplotlib._api import bar, line, plot, render, scatter, waterfall
-from botplotlib.figure import Figure
-from botplotlib.spec.models import PlotSpec
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# The ``render`` subpackage shares its name with the ``render()`` function.
+# Import it up front so later ``botplotlib.render.*`` imports never rebind
+# the attribute; the ``render()`` definition below then takes the name.
+importlib.import_module("botplotlib.render")
+
+# The package itself, so render()'s annotations can name the lazy exports:
+# ``typing.get_type_hints`` evaluates them against this module's globals,
+# where ``PlotSpec`` and ``Figure`` only exist once resolved.
+import botplotlib as _pkg  # noqa: E402
+
+if TYPE_CHECKING:
+    from botplotlib._api import bar, line, plot, scatter, waterfall
+    from botplotlib.figure import Figure
+    from botplotlib.spec.models import PlotSpec
 
 __version__ = "0.1.0"
 
@@ -17,3 +33,49 @@ __all__ = [
     "Figure",
     "PlotSpec",
 ]
+
+# Public names are resolved on first access (PEP 562), so ``import
+# botplotlib`` doesn't pay for pydantic and the compiler until it's used.
+_LAZY_EXPORTS: dict[str, str] = {
+    "bar": "botplotlib._api",
+    "line": "botplotlib._api",
+    "plot": "botplotlib._api",
+    "scatter": "botplotlib._api",
+    "waterfall": "botplotlib._api",
+    "Figure": "botplotlib.figure",
+    "PlotSpec": "botplotlib.spec.models",
+}
+
+
+# Subpackages that eager imports used to load as a side effect; generated
+# refactor code relies on ``blt.spec.models`` resolving without an import.
+_LAZY_SUBMODULES = frozenset({"compiler", "figure", "geoms", "refactor", "spec"})
+
+
+def render(spec: _pkg.PlotSpec) -> _pkg.Figure:
+    """Render a PlotSpec into a Figure.
+
+    Parameters
+    ----------
+    spec:
+        A PlotSpec object (e.g., from the matplotlib refactor tool).
+    """
+    from botplotlib._api import render as _render
+
+    return _render(spec)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module 'botplotlib' has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
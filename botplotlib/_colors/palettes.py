@@ -7,6 +7,11 @@ calculations.
 
 from __future__ import annotations
 
+import string
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
 DEFAULT_PALETTE: list[str] = [
     "#4E79A7",  # steel blue
     "#C56A00",  # orange (WCAG AA compliant)
@@ -25,21 +30,27 @@ DEFAULT_PALETTE: list[str] = [
 # Hex / RGB conversion
 # ---------------------------------------------------------------------------
 
+_HEX_DIGITS = frozenset(string.hexdigits)
+
 
+@lru_cache(maxsize=256)
 def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     """Parse a hex color string to an ``(r, g, b)`` tuple.
 
     Accepts both short (``#abc`` or ``abc``) and long (``#aabbcc`` or
-    ``aabbcc``) forms, with or without the leading ``#``.
+    ``aabbcc``) forms, with or without the leading ``#``.  Results are
+    cached, since the same theme colors are parsed on every compile.
     """
     h = hex_color.lstrip("#")
     if len(h) == 3:
         h = h[0] * 2 + h[1] * 2 + h[2] * 2
-    if len(h) != 6:
+    # int(h, 16) alone would also accept "0x", "_", signs and whitespace.
+    if len(h) != 6 or not _HEX_DIGITS.issuperset(h):
         raise ValueError(
             f"Invalid hex color: {hex_color!r}. Expected format: '#RRGGBB' or '#RGB'."
         )
-    return int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
+    v = int(h, 16)
+    return (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
 
 
 def rgb_to_hex(r: int, g: int, b: int) -> str:
@@ -53,27 +64,24 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
 
 
 def assign_colors(
-    groups: list[str],
+    groups: Sequence[Any],
     palette: list[str] | None = None,
 ) -> dict[str, str]:
     """Assign a color to each unique group name.
 
-    Colors are drawn from *palette* (defaulting to :data:`DEFAULT_PALETTE`)
-    in order.  If there are more groups than palette entries the palette
-    cycles.
+    *groups* is a raw color column; values are stringified to form group
+    names.  Colors are drawn from *palette* (defaulting to
+    :data:`DEFAULT_PALETTE`) in order.  If there are more groups than
+    palette entries the palette cycles.
 
     Returns a ``{group_name: hex_color}`` mapping that preserves the
     insertion order of *groups* (first occurrence).
     """
     if palette is None:
         palette = DEFAULT_PALETTE
-    seen: dict[str, str] = {}
-    idx = 0
-    for group in groups:
-        if group not in seen:
-            seen[group] = palette[idx % len(palette)]
-            idx += 1
-    return seen
+    n = len(palette)
+    names = dict.fromkeys(map(str, groups))
+    return {g: palette[i % n] for i, g in enumerate(names)}
 
 
 # ---------------------------------------------------------------------------
@@ -88,20 +96,26 @@ def _linearize(channel: float) -> float:
     return ((channel + 0.055) / 1.055) ** 2.4
 
 
+# Channels are 8-bit integers, so the whole linearization curve fits in a
+# 256-entry table built once at import time.
+_SRGB_LIN: tuple[float, ...] = tuple(_linearize(c / 255.0) for c in range(256))
+
+
+@lru_cache(maxsize=256)
 def relative_luminance(hex_color: str) -> float:
     """Compute the WCAG relative luminance of a hex color.
 
     The luminance is a value between 0.0 (black) and 1.0 (white).
+    Results are cached: themes reuse the same handful of colors on every
+    compile.
 
     See https://www.w3.org/TR/WCAG21/#dfn-relative-luminance
     """
     r, g, b = hex_to_rgb(hex_color)
-    r_lin = _linearize(r / 255.0)
-    g_lin = _linearize(g / 255.0)
-    b_lin = _linearize(b / 255.0)
-    return 0.2126 * r_lin + 0.7152 * g_lin + 0.0722 * b_lin
+    return 0.2126 * _SRGB_LIN[r] + 0.7152 * _SRGB_LIN[g] + 0.0722 * _SRGB_LIN[b]
 
 
+@lru_cache(maxsize=1024)
 def contrast_ratio(color1: str, color2: str) -> float:
     """Compute the WCAG contrast ratio between two hex colors.
 
@@ -110,8 +124,15 @@ def contrast_ratio(color1: str, color2: str) -> float:
 
     See https://www.w3.org/TR/WCAG21/#dfn-contrast-ratio
     """
-    l1 = relative_luminance(color1)
-    l2 = relative_luminance(color2)
+    return luminance_ratio(relative_luminance(color1), relative_luminance(color2))
+
+
+def luminance_ratio(l1: float, l2: float) -> float:
+    """Compute the WCAG contrast ratio from two precomputed luminances.
+
+    Lets callers that check many colors against one reference compute each
+    luminance once instead of once per pair.
+    """
     if l2 > l1:
         l1, l2 = l2, l1
     return (l1 + 0.05) / (l2 + 0.05)
@@ -27,6 +27,18 @@ def _load_font_table(font_name: str) -> dict[str, float]:
     return table
 
 
+@lru_cache(maxsize=None)
+def _ascii_width_table(font_name: str) -> tuple[float, ...]:
+    """Return *font_name*'s widths as a tuple indexed by ASCII code point.
+
+    Lets :func:`text_width` gather ASCII strings with a C-level ``map``
+    over the encoded bytes instead of one dict lookup per character.
+    """
+    table = _load_font_table(font_name)
+    return tuple(table.get(chr(cp), _DEFAULT_CHAR_WIDTH) for cp in range(128))
+
+
+@lru_cache(maxsize=4096)
 def text_width(
     text: str,
     font_size: float,
@@ -36,8 +48,12 @@ def text_width(
 
     Each character's relative width (as a fraction of font size) is
     looked up in the font table.  Characters not present in the table
-    fall back to a default width of 0.5.
+    fall back to a default width of 0.5.  Results are cached, since tick
+    labels and category names are measured over and over.
     """
+    if text.isascii():
+        widths = _ascii_width_table(font_name)
+        return sum(map(widths.__getitem__, text.encode("ascii"))) * font_size
     table = _load_font_table(font_name)
     return sum(table.get(ch, _DEFAULT_CHAR_WIDTH) for ch in text) * font_size
 
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Point:
     """A 2D point in pixel coordinates."""
 
@@ -13,7 +13,7 @@ class Point:
     y: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rect:
     """An axis-aligned rectangle in pixel coordinates."""
 
@@ -22,13 +22,13 @@ class Rect:
     width: float
     height: float
 
-    @property
-    def right(self) -> float:
-        return self.x + self.width
+    # Derived edges, stored once so collision checks read plain attributes.
+    right: float = field(init=False, repr=False, compare=False)
+    bottom: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def bottom(self) -> float:
-        return self.y + self.height
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "right", self.x + self.width)
+        object.__setattr__(self, "bottom", self.y + self.height)
 
     @property
     def center(self) -> Point:
@@ -36,15 +36,13 @@ class Rect:
 
     def intersects(self, other: Rect) -> bool:
         """Check if this rectangle overlaps with another."""
-        return (
-            self.x < other.right
-            and self.right > other.x
-            and self.y < other.bottom
-            and self.bottom > other.y
-        )
+        # Disjoint on x is the common case for tick labels, so test it first.
+        if self.x >= other.right or other.x >= self.right:
+            return False
+        return self.y < other.bottom and other.y < self.bottom
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TickMark:
     """A tick mark on an axis."""
 
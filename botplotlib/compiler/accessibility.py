@@ -7,7 +7,11 @@ gate from the Cyborg Social Contract.
 
 from __future__ import annotations
 
-from botplotlib._colors.palettes import contrast_ratio
+from botplotlib._colors.palettes import (
+    contrast_ratio,
+    luminance_ratio,
+    relative_luminance,
+)
 
 
 class ContrastError(Exception):
@@ -78,8 +82,9 @@ def check_palette_contrast(
     ContrastError
         If any palette color fails the contrast check.
     """
+    bg_lum = relative_luminance(background_color)
     for i, color in enumerate(palette):
-        ratio = contrast_ratio(color, background_color)
+        ratio = luminance_ratio(relative_luminance(color), bg_lum)
         if ratio < min_ratio:
             raise ContrastError(
                 f"Palette color {i} ({color}) on background {background_color} "
@@ -107,8 +112,9 @@ def check_adjacent_contrast(
     ContrastError
         If adjacent colors are too similar.
     """
+    lums = [relative_luminance(c) for c in palette]
     for i in range(len(palette) - 1):
-        ratio = contrast_ratio(palette[i], palette[i + 1])
+        ratio = luminance_ratio(lums[i], lums[i + 1])
         if ratio < min_ratio:
             raise ContrastError(
                 f"Adjacent palette colors {i} ({palette[i]}) and "
@@ -48,11 +48,39 @@ from botplotlib.spec.theme import ThemeSpec, resolve_theme
 # clipped at the plot-area boundary.  Analogous to ggplot2's `expand`.
 _SCALE_PAD = 0.03
 
+# Whether to nudge overlapping x-tick labels apart.  Off until nudged
+# positions are actually written back to the (frozen) TickMarks; until then
+# the collision pass is pure overhead.
+_NUDGE_X_TICK_LABELS = False
+
 # ---------------------------------------------------------------------------
 # Compiler
 # ---------------------------------------------------------------------------
 
 
+def _extent(values: list[float]) -> tuple[float, float] | None:
+    """Return ``(min, max)`` of the non-NaN *values* in a single pass.
+
+    NaNs (common from pandas input) are skipped wherever they appear, so a
+    layer whose column starts with NaN still contributes its real range.
+    Returns None when there is nothing but NaN.
+    """
+    it = iter(values)
+    for lo in it:
+        if lo == lo:  # first non-NaN value seeds the range
+            break
+    else:
+        return None
+    hi = lo
+    # NaN compares False both ways, so later NaNs fall through untouched.
+    for v in it:
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    return lo, hi
+
+
 def compile_spec(spec: PlotSpec) -> CompiledPlot:
     """Compile a PlotSpec into positioned geometry.
 
@@ -84,8 +112,7 @@ def compile_spec(spec: PlotSpec) -> CompiledPlot:
     color_map: dict[str, str] = {}
     for layer in spec.layers:
         if layer.color and layer.color in data:
-            groups = [str(v) for v in data[layer.color]]
-            color_map = assign_colors(groups, theme.palette)
+            color_map = assign_colors(data[layer.color], theme.palette)
             if layer.color_map:
                 color_map.update(layer.color_map)
                 check_palette_contrast(
@@ -219,8 +246,10 @@ def compile_spec(spec: PlotSpec) -> CompiledPlot:
         layer_geoms.append((layer, geom, hint))
 
     # Merge hints into unified scales
-    all_x_numeric: list[float] = []
-    all_y_numeric: list[float] = []
+    # Only each layer's extremes matter for the scales, so reduce every hint
+    # to its (min, max) rather than concatenating whole columns.
+    x_bounds: list[float] = []
+    y_bounds: list[float] = []
     x_is_categorical = False
     all_categories: list[str] = []
 
@@ -228,9 +257,10 @@ def compile_spec(spec: PlotSpec) -> CompiledPlot:
         if hint.x_type == "categorical":
             x_is_categorical = True
             all_categories.extend(hint.x_categories)
-        else:
-            all_x_numeric.extend(hint.x_numeric)
-        all_y_numeric.extend(hint.y_numeric)
+        elif x_extent := _extent(hint.x_numeric):
+            x_bounds += x_extent
+        if y_extent := _extent(hint.y_numeric):
+            y_bounds += y_extent
 
     # Compute scales and ticks
     if x_is_categorical:
@@ -245,8 +275,8 @@ def compile_spec(spec: PlotSpec) -> CompiledPlot:
             TickMark(value=i, label=cat, pixel_pos=x_scale.map(cat))
             for i, cat in enumerate(unique_cats)
         ]
-    elif all_x_numeric:
-        x_tick_vals = nice_ticks(min(all_x_numeric), max(all_x_numeric))
+    elif x_bounds:
+        x_tick_vals = nice_ticks(min(x_bounds), max(x_bounds))
         x_pad = (x_tick_vals[-1] - x_tick_vals[0]) * _SCALE_PAD
         x_scale = LinearScale(
             data_min=x_tick_vals[0] - x_pad,
@@ -262,8 +292,8 @@ def compile_spec(spec: PlotSpec) -> CompiledPlot:
         # No data — use a dummy scale
         x_scale = LinearScale(0, 1, plot_area.x, plot_area.right)
 
-    if all_y_numeric:
-        y_tick_vals = nice_ticks(min(all_y_numeric), max(all_y_numeric))
+    if y_bounds:
+        y_tick_vals = nice_ticks(min(y_bounds), max(y_bounds))
     else:
         y_tick_vals = nice_ticks(0, 1)
 
@@ -289,9 +319,7 @@ def compile_spec(spec: PlotSpec) -> CompiledPlot:
     )
 
     for layer, geom, _hint in layer_geoms:
-        primitives = geom.compile(layer, data, resolved, theme, plot_area)
-        for prim in primitives:
-            compiled.add_primitive(prim)
+        compiled.add_primitives(geom.compile(layer, data, resolved, theme, plot_area))
 
     # Add legend entries
     if has_legend and color_map:
@@ -311,7 +339,12 @@ def _avoid_tick_collisions(
     theme: ThemeSpec,
 ) -> None:
     """Apply collision avoidance to tick labels."""
+    if not _NUDGE_X_TICK_LABELS:
+        return
     if len(compiled.x_ticks) > 1:
+        # x_ticks are emitted in ascending pixel order (nice_ticks is sorted
+        # and categories map left to right), so the labels are already in
+        # the x order a sweep needs and zip() below keeps tick/label pairs.
         labels = [
             TextLabel(
                 text=t.label,
@@ -13,7 +13,7 @@ Follows the stated column-access protocol documented in AGENTS.md:
 
 from __future__ import annotations
 
-import types
+from collections.abc import Callable, Iterator
 from typing import Any
 
 
@@ -28,20 +28,57 @@ def _transpose_records(records: list[dict]) -> dict[str, list]:
     """Transpose a list of row dicts to a columnar dict."""
     if not records:
         return {}
-    columns: dict[str, list] = {}
-    # Use all keys from all records for robustness
-    all_keys: list[str] = []
-    seen: set[str] = set()
-    for record in records:
-        for key in record:
-            if key not in seen:
-                all_keys.append(key)
-                seen.add(key)
-    for key in all_keys:
-        columns[key] = [record.get(key) for record in records]
+    n = len(records)
+    # Preallocate one column per key and fill by row index in a single
+    # pass.  Keys keep first-seen order across all records; a key missing
+    # from a record leaves None in that row.
+    columns: dict[str, list] = {key: [None] * n for key in records[0]}
+    for i, record in enumerate(records):
+        for key, value in record.items():
+            col = columns.get(key)
+            if col is None:
+                col = columns[key] = [None] * n
+            col[i] = value
     return columns
 
 
+def _from_dict(data: dict) -> dict[str, list]:
+    """Dispatch path 1: dict with list-like (or scalar) values."""
+    result: dict[str, list] = {}
+    for key, val in data.items():
+        if _is_list_like(val):
+            result[str(key)] = list(val)
+        else:
+            result[str(key)] = [val]
+    return result
+
+
+def _from_list(data: list) -> dict[str, list]:
+    """Dispatch path 2: list[dict] row-oriented records."""
+    if len(data) == 0:
+        return {}
+    if isinstance(data[0], dict):
+        return _transpose_records(data)
+    raise TypeError(
+        f"Expected list of dicts, got list of {type(data[0]).__name__}. "
+        "Each record should look like {{'x': 1, 'y': 2}}. "
+        "Supported formats: dict, list[dict], Polars DataFrame, "
+        "Pandas DataFrame, Arrow Table/RecordBatch, generator."
+    )
+
+
+# Sentinel for an iterator that yields nothing.
+_EXHAUSTED = object()
+
+# Exact-type fast path for the two common inputs: one dict lookup instead of
+# walking the isinstance/hasattr chain below.  Subclasses (OrderedDict,
+# defaultdict, ...) miss here and are caught by the isinstance checks.
+_NORMALIZERS: dict[type, Callable[[Any], dict[str, list]]] = {
+    dict: _from_dict,
+    list: _from_list,
+}
+
+
 def normalize_data(data: Any) -> dict[str, list]:
     """Normalize input data to a columnar dict.
 
@@ -62,28 +99,17 @@ def normalize_data(data: Any) -> dict[str, list]:
     TypeError
         If the data format is not recognized.
     """
+    handler = _NORMALIZERS.get(type(data))
+    if handler is not None:
+        return handler(data)
+
     # 1. dict with list-like values
     if isinstance(data, dict):
-        result: dict[str, list] = {}
-        for key, val in data.items():
-            if _is_list_like(val):
-                result[str(key)] = list(val)
-            else:
-                result[str(key)] = [val]
-        return result
+        return _from_dict(data)
 
     # 2. list[dict] — row-oriented records
     if isinstance(data, list):
-        if len(data) == 0:
-            return {}
-        if isinstance(data[0], dict):
-            return _transpose_records(data)
-        raise TypeError(
-            f"Expected list of dicts, got list of {type(data[0]).__name__}. "
-            "Each record should look like {{'x': 1, 'y': 2}}. "
-            "Supported formats: dict, list[dict], Polars DataFrame, "
-            "Pandas DataFrame, Arrow Table/RecordBatch, generator."
-        )
+        return _from_list(data)
 
     # 3. Polars DataFrame
     if hasattr(data, "get_column") and hasattr(data, "columns"):
@@ -98,16 +124,16 @@ def normalize_data(data: Any) -> dict[str, list]:
         return {name: data.column(name).to_pylist() for name in data.column_names}
 
     # 6. Generator/iterator — materialize then transpose
-    if isinstance(data, (types.GeneratorType,)) or (
-        hasattr(data, "__iter__") and hasattr(data, "__next__")
-    ):
-        records = list(data)
-        if not records:
+    if isinstance(data, Iterator):
+        # Peek at the first item so a non-dict stream fails before the
+        # rest of it is materialized.
+        first = next(data, _EXHAUSTED)
+        if first is _EXHAUSTED:
             return {}
-        if isinstance(records[0], dict):
-            return _transpose_records(records)
+        if isinstance(first, dict):
+            return _transpose_records([first, *data])
         raise TypeError(
-            f"Generator yielded {type(records[0]).__name__}, expected dicts. "
+            f"Generator yielded {type(first).__name__}, expected dicts. "
             "Each yielded item should look like {{'x': 1, 'y': 2}}. "
             "Supported formats: dict, list[dict], Polars DataFrame, "
             "Pandas DataFrame, Arrow Table/RecordBatch, generator of dicts."
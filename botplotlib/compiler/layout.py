@@ -10,12 +10,13 @@ Handles:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from botplotlib._fonts.metrics import text_bbox, text_height
 from botplotlib._types import Rect
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LayoutResult:
     """Result of the layout computation."""
 
@@ -30,6 +31,7 @@ class LayoutResult:
     legend_area: Rect | None = None
 
 
+@lru_cache(maxsize=128)
 def compute_layout(
     canvas_width: float,
     canvas_height: float,
@@ -57,6 +59,8 @@ def compute_layout(
     """Compute box-model layout for a plot.
 
     Returns a LayoutResult with pixel coordinates for all plot regions.
+    The function is pure over scalar inputs, so results are cached and the
+    (frozen) LayoutResult is shared between calls with the same arguments.
     """
     # Adjust margins for labels
     effective_top = margin_top
@@ -186,7 +190,7 @@ def compute_layout(
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class TextLabel:
     """A positioned text label for collision avoidance."""
 
@@ -222,35 +226,49 @@ def avoid_collisions(
     if len(labels) <= 1:
         return list(labels)
 
-    # Work with mutable copies
-    result = [
+    # Labels only ever move vertically, so each box's horizontal extent and
+    # height are fixed: measure once, then track just the y coordinates.
+    boxes = [lbl.bbox() for lbl in labels]
+    ys = [lbl.y for lbl in labels]
+    heights = [b.height for b in boxes]
+
+    # The x-overlapping pairs can't change either.  Find them with one
+    # sweep over the boxes sorted by left edge, then only those pairs are
+    # re-tested for y overlap each iteration (in the original i < j order).
+    order = sorted(range(len(boxes)), key=lambda k: boxes[k].x)
+    pairs: list[tuple[int, int]] = []
+    for pos, i in enumerate(order):
+        left_i, right_i = boxes[i].x, boxes[i].right
+        for j in order[pos + 1 :]:
+            if boxes[j].x >= right_i:
+                break
+            if left_i < boxes[j].right:
+                pairs.append((i, j) if i < j else (j, i))
+    pairs.sort()
+
+    for _ in range(max_iterations):
+        any_overlap = False
+        for i, j in pairs:
+            if ys[i] < ys[j] + heights[j] and ys[j] < ys[i] + heights[i]:
+                any_overlap = True
+                # Nudge apart vertically
+                if ys[i] <= ys[j]:
+                    ys[i] -= nudge_step
+                    ys[j] += nudge_step
+                else:
+                    ys[i] += nudge_step
+                    ys[j] -= nudge_step
+        if not any_overlap:
+            break
+
+    return [
         TextLabel(
             text=lbl.text,
             x=lbl.x,
-            y=lbl.y,
+            y=y,
             font_size=lbl.font_size,
             font_name=lbl.font_name,
             anchor=lbl.anchor,
         )
-        for lbl in labels
+        for lbl, y in zip(labels, ys)
     ]
-
-    for _ in range(max_iterations):
-        any_overlap = False
-        for i in range(len(result)):
-            for j in range(i + 1, len(result)):
-                bbox_i = result[i].bbox()
-                bbox_j = result[j].bbox()
-                if bbox_i.intersects(bbox_j):
-                    any_overlap = True
-                    # Nudge apart vertically
-                    if result[i].y <= result[j].y:
-                        result[i].y -= nudge_step
-                        result[j].y += nudge_step
-                    else:
-                        result[i].y += nudge_step
-                        result[j].y -= nudge_step
-        if not any_overlap:
-            break
-
-    return result
@@ -8,6 +8,15 @@ Reference:
 from __future__ import annotations
 
 import math
+from functools import lru_cache
+
+# Powers of ten for the exponents plot data actually uses, so nice_num can
+# index instead of calling pow().  Built from exact ints, hence the same
+# (correctly rounded) floats that ``10**exp`` produces in arithmetic.
+_DECADE_MIN, _DECADE_MAX = -30, 30
+_DECADES: tuple[float, ...] = tuple(
+    float(10**e) for e in range(_DECADE_MIN, _DECADE_MAX + 1)
+)
 
 
 def nice_num(x: float, round_down: bool = False) -> float:
@@ -37,7 +46,11 @@ def nice_num(x: float, round_down: bool = False) -> float:
         )
 
     exp = math.floor(math.log10(x))
-    frac = x / (10**exp)  # fraction in [1, 10)
+    if _DECADE_MIN <= exp <= _DECADE_MAX:
+        decade: float = _DECADES[exp - _DECADE_MIN]
+    else:
+        decade = 10**exp
+    frac = x / decade  # fraction in [1, 10)
 
     if round_down:
         if frac < 2:
@@ -56,7 +69,7 @@ def nice_num(x: float, round_down: bool = False) -> float:
         else:
             nice = 10.0
 
-    return nice * (10**exp)
+    return nice * decade
 
 
 def nice_ticks(data_min: float, data_max: float, max_ticks: int = 7) -> list[float]:
@@ -87,6 +100,17 @@ def nice_ticks(data_min: float, data_max: float, max_ticks: int = 7) -> list[flo
     list[float]
         Sorted list of tick values.
     """
+    # Callers get their own list; the cached tuple is shared.
+    return list(_nice_ticks(data_min, data_max, max_ticks))
+
+
+@lru_cache(maxsize=256)
+def _nice_ticks(data_min: float, data_max: float, max_ticks: int) -> tuple[float, ...]:
+    """Cached body of :func:`nice_ticks`.
+
+    Recompiles after non-data edits (title, theme, size) ask for the same
+    axis range again, and the result is a pure function of the arguments.
+    """
     if max_ticks < 2:
         max_ticks = 2
 
@@ -107,14 +131,12 @@ def nice_ticks(data_min: float, data_max: float, max_ticks: int = 7) -> list[flo
 
     # Guard against near-zero ranges caused by floating-point dust.
     if data_range < 1e-15:
-        return [data_min]
+        return (data_min,)
 
     tick_spacing = nice_num(data_range / (max_ticks - 1))
     graph_min = math.floor(data_min / tick_spacing) * tick_spacing
     graph_max = math.ceil(data_max / tick_spacing) * tick_spacing
 
-    # Build the list of tick values.
-    ticks: list[float] = []
     # Determine decimal places to use for rounding, avoiding float noise.
     # We round to enough decimal places to represent the tick spacing
     # faithfully.
@@ -123,22 +145,19 @@ def nice_ticks(data_min: float, data_max: float, max_ticks: int = 7) -> list[flo
     else:
         nfrac = 0
 
-    t = graph_min
-    # Use a generous upper bound to avoid infinite loops from float drift.
-    while t <= graph_max + tick_spacing * 0.5:
-        ticks.append(round(t, nfrac))
-        t += tick_spacing
+    # The ticks are an arithmetic progression, so compute the count up front
+    # and generate each value by index (no accumulated float drift).
+    count = int(math.floor((graph_max - graph_min) / tick_spacing + 0.5)) + 1
+    if tick_spacing >= 1:
+        # A nice spacing >= 1 is a whole number and graph_min is a multiple
+        # of it, so every tick is already integer-valued and round() would
+        # be a no-op.
+        ticks = [graph_min + i * tick_spacing for i in range(count)]
+    else:
+        ticks = [round(graph_min + i * tick_spacing, nfrac) for i in range(count)]
 
     # Remove any duplicate ticks that might appear due to rounding.
-    seen: set[float] = set()
-    unique: list[float] = []
-    for v in ticks:
-        if v not in seen:
-            seen.add(v)
-            unique.append(v)
-    ticks = unique
-
-    return ticks
+    return tuple(dict.fromkeys(ticks))
 
 
 def format_tick(value: float) -> str:
@@ -157,7 +176,7 @@ def format_tick(value: float) -> str:
     str
         A human-friendly string representation.
     """
-    if value == int(value) and math.isfinite(value):
+    if float(value).is_integer():  # False for inf/nan
         return str(int(value))
     # Format with enough precision, then strip trailing zeros.
     formatted = f"{value:.10g}"
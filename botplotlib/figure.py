@@ -129,6 +129,8 @@ class Figure:
 
     @title.setter
     def title(self, value: str | None) -> None:
+        if value == self._spec.labels.title:
+            return  # no-op update: keep the cached render
         self._spec.labels.title = value
         self._invalidate()
 
@@ -138,6 +140,8 @@ class Figure:
 
     @subtitle.setter
     def subtitle(self, value: str | None) -> None:
+        if value == self._spec.labels.subtitle:
+            return  # no-op update: keep the cached render
         self._spec.labels.subtitle = value
         self._invalidate()
 
@@ -147,6 +151,8 @@ class Figure:
 
     @footnote.setter
     def footnote(self, value: str | None) -> None:
+        if value == self._spec.labels.footnote:
+            return  # no-op update: keep the cached render
         self._spec.labels.footnote = value
         self._invalidate()
 
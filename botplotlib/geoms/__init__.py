@@ -10,15 +10,16 @@ To add a new geom, see the recipe in AGENTS.md.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from botplotlib.geoms.primitives import Primitive
+from botplotlib.spec.scales import CategoricalScale, LinearScale
 
 if TYPE_CHECKING:
     from botplotlib._types import Rect
     from botplotlib.spec.models import LayerSpec
-    from botplotlib.spec.scales import CategoricalScale, LinearScale
     from botplotlib.spec.theme import ThemeSpec
 
 
@@ -27,7 +28,7 @@ if TYPE_CHECKING:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ScaleHint:
     """What a geom layer contributes to scale computation.
 
@@ -42,7 +43,7 @@ class ScaleHint:
     x_categories: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedScales:
     """Scales computed by the compiler, passed to geom.compile()."""
 
@@ -52,6 +53,47 @@ class ResolvedScales:
     default_color: str = "#1f77b4"
 
 
+def coerce_numeric(values: Sequence[object]) -> list[float]:
+    """Convert a column to floats, silently dropping non-numeric cells.
+
+    Used by ``scale_hint`` implementations, where a stray label or None
+    should not widen (or break) the scale.  All-numeric columns, the usual
+    case, are converted in a single pass with no exception handling per
+    value; only a column that fails falls back to checking cell by cell.
+    """
+    try:
+        return list(map(float, values))  # type: ignore[arg-type]
+    except (ValueError, TypeError):
+        pass
+    numeric: list[float] = []
+    for v in values:
+        try:
+            numeric.append(float(v))  # type: ignore[arg-type]
+        except (ValueError, TypeError):
+            pass
+    return numeric
+
+
+def map_column(
+    scale: LinearScale | CategoricalScale, values: list[float] | list[str]
+) -> list[float]:
+    """Map a whole column of data values to pixel positions.
+
+    Linear scales are applied inline from their coefficients() and
+    categorical scales through a position table, which avoids a method
+    call per value on large columns.
+    """
+    if isinstance(scale, CategoricalScale):
+        table = scale.positions()
+        try:
+            return [table[v] for v in values]  # type: ignore[index]
+        except KeyError:
+            pass  # let map() raise its usual error for the unknown category
+        return [scale.map(v) for v in values]  # type: ignore[arg-type]
+    d0, p0, k = scale.coefficients()
+    return [p0 + (v - d0) * k for v in values]  # type: ignore[operator]
+
+
 # ---------------------------------------------------------------------------
 # Geom base class
 # ---------------------------------------------------------------------------
@@ -73,6 +115,22 @@ class Geom(ABC):
         Raise ValueError with a clear, actionable message if validation fails.
         """
 
+    def require_columns(
+        self, data: dict[str, list], columns: list[tuple[str, str]]
+    ) -> None:
+        """Raise ValueError naming the first missing ``(column, role)`` pair.
+
+        Helper for ``validate`` implementations, built-in and third-party:
+        the message names the geom, the column, its role and the columns
+        the data actually has.
+        """
+        for col_name, role in columns:
+            if col_name not in data:
+                raise ValueError(
+                    f"{self.name.capitalize()} geom requires column '{col_name}' "
+                    f"for {role} axis, but data has columns: {sorted(data.keys())}."
+                )
+
     @abstractmethod
     def scale_hint(self, layer: LayerSpec, data: dict[str, list]) -> ScaleHint:
         """Declare what scales this geom needs and contribute data ranges.
@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
-from botplotlib._colors.palettes import relative_luminance
 from botplotlib._types import Rect
-from botplotlib.geoms import Geom, ResolvedScales, ScaleHint
-from botplotlib.geoms.labels import format_label, label_fits_inside
+from botplotlib.geoms import (
+    Geom,
+    ResolvedScales,
+    ScaleHint,
+    coerce_numeric,
+    map_column,
+)
+from botplotlib.geoms.labels import (
+    format_label,
+    inside_label_color,
+    label_fits_inside,
+)
 from botplotlib.geoms.primitives import CompiledBar, CompiledText, Primitive
 from botplotlib.spec.models import LayerSpec
 from botplotlib.spec.scales import CategoricalScale
@@ -18,21 +27,12 @@ class BarGeom(Geom):
     name = "bar"
 
     def validate(self, layer: LayerSpec, data: dict[str, list]) -> None:
-        for col_name, role in [(layer.x, "x"), (layer.y, "y")]:
-            if col_name not in data:
-                raise ValueError(
-                    f"Bar geom requires column '{col_name}' for {role} axis, "
-                    f"but data has columns: {sorted(data.keys())}."
-                )
+        self.require_columns(data, [(layer.x, "x"), (layer.y, "y")])
 
     def scale_hint(self, layer: LayerSpec, data: dict[str, list]) -> ScaleHint:
-        categories = [str(v) for v in data.get(layer.x, [])]
-        y_vals: list[float] = []
-        for v in data.get(layer.y, []):
-            try:
-                y_vals.append(float(v))
-            except (ValueError, TypeError):
-                pass
+        # Dedupe in C (order-preserving); the compiler only needs uniques.
+        categories = list(dict.fromkeys(map(str, data.get(layer.x, []))))
+        y_vals = coerce_numeric(data.get(layer.y, []))
         # Include 0 baseline — bar charts always start from zero
         return ScaleHint(
             x_type="categorical",
@@ -66,51 +66,71 @@ class BarGeom(Geom):
         band = scales.x.band_width
         bar_width = band * (1 - theme.bar_padding)
         baseline = scales.y.map(0)
+        half_w = bar_width / 2
+        get_color = scales.color_map.get
+        default_color = scales.default_color
+        font_size = theme.tick_font_size
+        font_name = theme.font_name
+        text_color = theme.text_color
+        label_dy = font_size / 3
+
+        # Map whole columns up front rather than one scale call per bar.
+        cx_col = map_column(scales.x, categories)
+        y_px_col = map_column(scales.y, y_vals)
+
+        # Resolve fills for the whole column up front, as ScatterGeom does.
+        n = min(len(categories), len(y_vals))
+        groups: list[str] | list[None]
+        if color_col:
+            groups = color_col
+            colors = [get_color(g, default_color) for g in color_col]
+        else:
+            groups = [None] * n
+            colors = [default_color] * n
 
         primitives: list[Primitive] = []
-        for i in range(min(len(categories), len(y_vals))):
-            cx = scales.x.map(categories[i])
-            y_px = scales.y.map(y_vals[i])
-            color = (
-                scales.color_map.get(color_col[i], scales.default_color)
-                if color_col
-                else scales.default_color
-            )
-            bar_h = abs(baseline - y_px)
-            primitives.append(
+        append = primitives.append
+        for i in range(n):
+            cx = cx_col[i]
+            y_px = y_px_col[i]
+            group = groups[i]
+            color = colors[i]
+            # One compare instead of min()/max()/abs() builtin calls.
+            if y_px < baseline:
+                bar_y, bar_bottom = y_px, baseline
+            else:
+                bar_y, bar_bottom = baseline, y_px
+            bar_h = bar_bottom - bar_y
+            append(
                 CompiledBar(
-                    px=cx - bar_width / 2,
-                    py=min(y_px, baseline),
+                    px=cx - half_w,
+                    py=bar_y,
                     bar_width=bar_width,
                     bar_height=bar_h,
                     color=color,
-                    group=color_col[i] if color_col else None,
+                    group=group,
                 )
             )
 
             if layer.labels:
                 label_text = format_label(y_vals[i], layer.label_format)
-                font_size = theme.tick_font_size
                 inside = label_fits_inside(
                     label_text,
                     font_size,
                     bar_width,
                     bar_h,
-                    font_name=theme.font_name,
+                    font_name=font_name,
                 )
                 if inside:
                     label_x = cx
-                    label_y = (
-                        min(y_px, baseline) + max(y_px, baseline)
-                    ) / 2 + font_size / 3
-                    lum = relative_luminance(color)
-                    label_color = "#FFFFFF" if lum < 0.4 else theme.text_color
+                    label_y = (bar_y + bar_bottom) / 2 + label_dy
+                    label_color = inside_label_color(color, text_color)
                 else:
                     label_x = cx
-                    label_y = min(y_px, baseline) - 5
-                    label_color = theme.text_color
+                    label_y = bar_y - 5
+                    label_color = text_color
 
-                primitives.append(
+                append(
                     CompiledText(
                         text=label_text,
                         x=label_x,
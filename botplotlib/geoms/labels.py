@@ -6,8 +6,14 @@ shared by BarGeom, WaterfallGeom, and future bar variants.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+from botplotlib._colors.palettes import relative_luminance
 from botplotlib._fonts.metrics import text_height, text_width
 
+# Fills darker than this relative luminance get white inside-labels.
+_DARK_FILL_LUMINANCE = 0.4
+
 
 def format_label(value: float, label_format: str | None = None) -> str:
     """Format a numeric value for display on a bar.
@@ -22,7 +28,7 @@ def format_label(value: float, label_format: str | None = None) -> str:
     """
     if label_format is not None:
         return label_format.format(value)
-    if value == int(value):
+    if float(value).is_integer():
         return str(int(value))
     return f"{value:g}"
 
@@ -36,6 +42,20 @@ def label_fits_inside(
     padding: float = 4.0,
 ) -> bool:
     """Return True if the label text fits inside the bar with padding."""
-    tw = text_width(label_text, font_size, font_name)
-    th = text_height(font_size)
-    return (tw + 2 * padding) <= bar_width and (th + 2 * padding) <= bar_height
+    # Height depends only on the font size, so test it first: short bars
+    # are rejected without measuring the label text.
+    if text_height(font_size) + 2 * padding > bar_height:
+        return False
+    return text_width(label_text, font_size, font_name) + 2 * padding <= bar_width
+
+
+@lru_cache(maxsize=256)
+def inside_label_color(fill: str, text_color: str) -> str:
+    """Return the label color for text drawn on top of *fill*.
+
+    White on dark fills, otherwise the theme *text_color*.  Cached, since a
+    chart only has a handful of fill colors but one label per bar.
+    """
+    if relative_luminance(fill) < _DARK_FILL_LUMINANCE:
+        return "#FFFFFF"
+    return text_color
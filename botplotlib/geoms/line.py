@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
+
 from botplotlib._types import Rect
-from botplotlib.geoms import Geom, ResolvedScales, ScaleHint
+from botplotlib.geoms import (
+    Geom,
+    ResolvedScales,
+    ScaleHint,
+    coerce_numeric,
+    map_column,
+)
 from botplotlib.geoms.primitives import CompiledLine, Primitive
 from botplotlib.spec.models import LayerSpec
 from botplotlib.spec.theme import ThemeSpec
@@ -15,31 +23,14 @@ class LineGeom(Geom):
     name = "line"
 
     def validate(self, layer: LayerSpec, data: dict[str, list]) -> None:
-        for col_name, role in [(layer.x, "x"), (layer.y, "y")]:
-            if col_name not in data:
-                raise ValueError(
-                    f"Line geom requires column '{col_name}' for {role} axis, "
-                    f"but data has columns: {sorted(data.keys())}."
-                )
+        self.require_columns(data, [(layer.x, "x"), (layer.y, "y")])
 
     def scale_hint(self, layer: LayerSpec, data: dict[str, list]) -> ScaleHint:
-        x_numeric: list[float] = []
-        y_numeric: list[float] = []
-        for v in data.get(layer.x, []):
-            try:
-                x_numeric.append(float(v))
-            except (ValueError, TypeError):
-                pass
-        for v in data.get(layer.y, []):
-            try:
-                y_numeric.append(float(v))
-            except (ValueError, TypeError):
-                pass
         return ScaleHint(
             x_type="numeric",
             y_type="numeric",
-            x_numeric=x_numeric,
-            y_numeric=y_numeric,
+            x_numeric=coerce_numeric(data.get(layer.x, [])),
+            y_numeric=coerce_numeric(data.get(layer.y, [])),
         )
 
     def compile(
@@ -59,15 +50,15 @@ class LineGeom(Geom):
         )
 
         primitives: list[Primitive] = []
+        # Map whole columns in one pass each, then zip into (x, y) points.
+        pts_col = zip(map_column(scales.x, x_vals), map_column(scales.y, y_vals))
 
         if color_col:
-            # Group by color
-            groups: dict[str, list[tuple[float, float]]] = {}
-            for i in range(min(len(x_vals), len(y_vals))):
-                g = color_col[i]
-                if g not in groups:
-                    groups[g] = []
-                groups[g].append((scales.x.map(x_vals[i]), scales.y.map(y_vals[i])))
+            # Group by color.  defaultdict skips the throwaway [] that
+            # setdefault() builds for every row; groups keep first-seen order.
+            groups: defaultdict[str, list[tuple[float, float]]] = defaultdict(list)
+            for g, pt in zip(color_col, pts_col):
+                groups[g].append(pt)
             for g, pts in groups.items():
                 primitives.append(
                     CompiledLine(
@@ -78,13 +69,9 @@ class LineGeom(Geom):
                     )
                 )
         else:
-            pts = [
-                (scales.x.map(x_vals[i]), scales.y.map(y_vals[i]))
-                for i in range(min(len(x_vals), len(y_vals)))
-            ]
             primitives.append(
                 CompiledLine(
-                    points=pts,
+                    points=list(pts_col),
                     color=scales.default_color,
                     width=theme.line_width,
                 )
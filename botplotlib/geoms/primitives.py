@@ -19,8 +19,13 @@ from botplotlib.spec.theme import ThemeSpec
 # Primitive types
 # ---------------------------------------------------------------------------
 
+# Primitives are created once per data point, so they are slotted: no
+# per-instance __dict__, smaller objects and faster attribute access in the
+# renderer.  They are left mutable because frozen dataclasses pay for an
+# object.__setattr__ call per field on construction.
 
-@dataclass
+
+@dataclass(slots=True)
 class CompiledPoint:
     """A positioned scatter point."""
 
@@ -31,7 +36,7 @@ class CompiledPoint:
     group: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CompiledLine:
     """A positioned polyline."""
 
@@ -41,7 +46,7 @@ class CompiledLine:
     group: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CompiledBar:
     """A positioned bar."""
 
@@ -53,7 +58,7 @@ class CompiledBar:
     group: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CompiledText:
     """A positioned text element."""
 
@@ -67,7 +72,7 @@ class CompiledText:
     font_weight: str = "normal"
 
 
-@dataclass
+@dataclass(slots=True)
 class CompiledPath:
     """An arbitrary SVG path.
 
@@ -83,7 +88,7 @@ class CompiledPath:
     group: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CompiledLegendEntry:
     """A legend entry."""
 
@@ -100,6 +105,17 @@ Primitive = Union[CompiledPoint, CompiledLine, CompiledBar, CompiledText, Compil
 # ---------------------------------------------------------------------------
 
 
+# Exact primitive type -> CompiledPlot legacy typed-list attribute.  One dict
+# lookup instead of an isinstance chain; types without an entry (subclasses,
+# CompiledPath) fall back to the chain.
+_TYPED_LIST_ATTR: dict[type, str] = {
+    CompiledPoint: "points",
+    CompiledLine: "lines",
+    CompiledBar: "bars",
+    CompiledText: "texts",
+}
+
+
 @dataclass
 class CompiledPlot:
     """Fully positioned geometry ready for rendering."""
@@ -127,15 +143,39 @@ class CompiledPlot:
     def add_primitive(self, prim: Primitive) -> None:
         """Add a primitive to both the unified list and the legacy typed list."""
         self.primitives.append(prim)
+        typed = self._typed_list(prim)
+        if typed is not None:
+            typed.append(prim)
+
+    def add_primitives(self, prims: list[Primitive]) -> None:
+        """Add a geom's whole output; same result as repeated add_primitive.
+
+        The unified list is extended in one go; each item is then routed to
+        its typed list through the exact-type table.
+        """
+        self.primitives.extend(prims)
+        for prim in prims:
+            typed = self._typed_list(prim)
+            if typed is not None:
+                typed.append(prim)
+
+    def _typed_list(self, prim: Primitive) -> list | None:
+        """Return the legacy typed list *prim* belongs in, if any."""
+        attr = _TYPED_LIST_ATTR.get(type(prim))
+        if attr is not None:
+            typed: list = getattr(self, attr)
+            return typed
+        # Subclasses of the primitive types miss the exact-type table.
         if isinstance(prim, CompiledPoint):
-            self.points.append(prim)
-        elif isinstance(prim, CompiledLine):
-            self.lines.append(prim)
-        elif isinstance(prim, CompiledBar):
-            self.bars.append(prim)
-        elif isinstance(prim, CompiledText):
-            self.texts.append(prim)
+            return self.points
+        if isinstance(prim, CompiledLine):
+            return self.lines
+        if isinstance(prim, CompiledBar):
+            return self.bars
+        if isinstance(prim, CompiledText):
+            return self.texts
         # CompiledPath goes only in primitives (renderer generalization handles it)
+        return None
 
 
 # ---------------------------------------------------------------------------
@@ -2,8 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from itertools import repeat
+
 from botplotlib._types import Rect
-from botplotlib.geoms import Geom, ResolvedScales, ScaleHint
+from botplotlib.geoms import (
+    Geom,
+    ResolvedScales,
+    ScaleHint,
+    coerce_numeric,
+    map_column,
+)
 from botplotlib.geoms.primitives import CompiledPoint, Primitive
 from botplotlib.spec.models import LayerSpec
 from botplotlib.spec.theme import ThemeSpec
@@ -15,31 +24,14 @@ class ScatterGeom(Geom):
     name = "scatter"
 
     def validate(self, layer: LayerSpec, data: dict[str, list]) -> None:
-        for col_name, role in [(layer.x, "x"), (layer.y, "y")]:
-            if col_name not in data:
-                raise ValueError(
-                    f"Scatter geom requires column '{col_name}' for {role} axis, "
-                    f"but data has columns: {sorted(data.keys())}."
-                )
+        self.require_columns(data, [(layer.x, "x"), (layer.y, "y")])
 
     def scale_hint(self, layer: LayerSpec, data: dict[str, list]) -> ScaleHint:
-        x_numeric: list[float] = []
-        y_numeric: list[float] = []
-        for v in data.get(layer.x, []):
-            try:
-                x_numeric.append(float(v))
-            except (ValueError, TypeError):
-                pass
-        for v in data.get(layer.y, []):
-            try:
-                y_numeric.append(float(v))
-            except (ValueError, TypeError):
-                pass
         return ScaleHint(
             x_type="numeric",
             y_type="numeric",
-            x_numeric=x_numeric,
-            y_numeric=y_numeric,
+            x_numeric=coerce_numeric(data.get(layer.x, [])),
+            y_numeric=coerce_numeric(data.get(layer.y, [])),
         )
 
     def compile(
@@ -58,20 +50,21 @@ class ScatterGeom(Geom):
             else None
         )
 
-        primitives: list[Primitive] = []
-        for i in range(min(len(x_vals), len(y_vals))):
-            color = (
-                scales.color_map.get(color_col[i], scales.default_color)
-                if color_col
-                else scales.default_color
-            )
-            primitives.append(
-                CompiledPoint(
-                    px=scales.x.map(x_vals[i]),
-                    py=scales.y.map(y_vals[i]),
-                    color=color,
-                    radius=theme.point_radius,
-                    group=color_col[i] if color_col else None,
-                )
-            )
+        # Map whole columns in one pass each, then zip into primitives.
+        px_col = map_column(scales.x, x_vals)
+        py_col = map_column(scales.y, y_vals)
+        if color_col:
+            get_color = scales.color_map.get
+            default = scales.default_color
+            colors: Iterable[str] = [get_color(g, default) for g in color_col]
+            groups: Iterable[str | None] = color_col
+        else:
+            colors = repeat(scales.default_color)
+            groups = repeat(None)
+
+        radius = theme.point_radius
+        primitives: list[Primitive] = [
+            CompiledPoint(px=px, py=py, color=color, radius=radius, group=group)
+            for px, py, color, group in zip(px_col, py_col, colors, groups)
+        ]
         return primitives
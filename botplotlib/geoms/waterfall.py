@@ -15,10 +15,21 @@ the next.
 
 from __future__ import annotations
 
-from botplotlib._colors.palettes import relative_luminance
+from itertools import accumulate
+
 from botplotlib._types import Rect
-from botplotlib.geoms import Geom, ResolvedScales, ScaleHint
-from botplotlib.geoms.labels import format_label, label_fits_inside
+from botplotlib.geoms import (
+    Geom,
+    ResolvedScales,
+    ScaleHint,
+    coerce_numeric,
+    map_column,
+)
+from botplotlib.geoms.labels import (
+    format_label,
+    inside_label_color,
+    label_fits_inside,
+)
 from botplotlib.geoms.primitives import (
     CompiledBar,
     CompiledLine,
@@ -36,28 +47,15 @@ class WaterfallGeom(Geom):
     name = "waterfall"
 
     def validate(self, layer: LayerSpec, data: dict[str, list]) -> None:
-        for col_name, role in [(layer.x, "x"), (layer.y, "y")]:
-            if col_name not in data:
-                raise ValueError(
-                    f"Waterfall geom requires column '{col_name}' for {role} axis, "
-                    f"but data has columns: {sorted(data.keys())}."
-                )
+        self.require_columns(data, [(layer.x, "x"), (layer.y, "y")])
 
     def scale_hint(self, layer: LayerSpec, data: dict[str, list]) -> ScaleHint:
-        categories = [str(v) for v in data.get(layer.x, [])]
-        y_vals: list[float] = []
-        for v in data.get(layer.y, []):
-            try:
-                y_vals.append(float(v))
-            except (ValueError, TypeError):
-                pass
-
-        # Compute running totals to determine y range
-        running = 0.0
-        all_endpoints = [0.0]
-        for v in y_vals:
-            running += v
-            all_endpoints.append(running)
+        # Dedupe in C (order-preserving); the compiler only needs uniques.
+        categories = list(dict.fromkeys(map(str, data.get(layer.x, []))))
+        y_vals = coerce_numeric(data.get(layer.y, []))
+
+        # Running totals (starting from the 0 baseline) determine the y range
+        all_endpoints = list(accumulate(y_vals, initial=0.0))
 
         return ScaleHint(
             x_type="categorical",
@@ -90,28 +88,40 @@ class WaterfallGeom(Geom):
         color_positive = theme.palette[0] if len(theme.palette) > 0 else "#2196F3"
         color_negative = theme.palette[1] if len(theme.palette) > 1 else "#F44336"
 
+        half_w = bar_width / 2
+        n = min(len(categories), len(y_vals))
+        cx_col = map_column(scales.x, categories)
+        font_size = theme.tick_font_size
+        font_name = theme.font_name
+        text_color = theme.text_color
+        label_dy = font_size / 3
+
+        # Running totals for every bar edge, mapped to pixels in one pass:
+        # bar i floats from edge i to edge i + 1, and its connector sits at
+        # edge i + 1 as well.
+        edges = list(accumulate(y_vals[:n], initial=0.0))
+        edge_px_col = map_column(scales.y, edges)
+
         primitives: list[Primitive] = []
-        running = 0.0
+        append = primitives.append
 
-        for i in range(min(len(categories), len(y_vals))):
+        for i in range(n):
             step = y_vals[i]
-            base = running
-            top = running + step
-            running = top
+            y_base_px = edge_px_col[i]
+            y_top_px = edge_px_col[i + 1]
+            cx = cx_col[i]
 
             # Bar from base to top (floating)
-            y_base_px = scales.y.map(base)
-            y_top_px = scales.y.map(top)
-            cx = scales.x.map(categories[i])
-
-            bar_y = min(y_base_px, y_top_px)
-            bar_h = abs(y_base_px - y_top_px)
+            if y_top_px < y_base_px:
+                bar_y, bar_h = y_top_px, y_base_px - y_top_px
+            else:
+                bar_y, bar_h = y_base_px, y_top_px - y_base_px
 
             color = color_positive if step >= 0 else color_negative
 
-            primitives.append(
+            append(
                 CompiledBar(
-                    px=cx - bar_width / 2,
+                    px=cx - half_w,
                     py=bar_y,
                     bar_width=bar_width,
                     bar_height=bar_h,
@@ -122,29 +132,27 @@ class WaterfallGeom(Geom):
 
             if layer.labels:
                 label_text = format_label(step, layer.label_format)
-                font_size = theme.tick_font_size
                 inside = label_fits_inside(
                     label_text,
                     font_size,
                     bar_width,
                     bar_h,
-                    font_name=theme.font_name,
+                    font_name=font_name,
                 )
                 if inside:
                     label_x = cx
-                    label_y = bar_y + bar_h / 2 + font_size / 3
-                    lum = relative_luminance(color)
-                    label_color = "#FFFFFF" if lum < 0.4 else theme.text_color
+                    label_y = bar_y + bar_h / 2 + label_dy
+                    label_color = inside_label_color(color, text_color)
                 elif step >= 0:
                     label_x = cx
                     label_y = bar_y - 5
-                    label_color = theme.text_color
+                    label_color = text_color
                 else:
                     label_x = cx
                     label_y = bar_y + bar_h + font_size + 2
-                    label_color = theme.text_color
+                    label_color = text_color
 
-                primitives.append(
+                append(
                     CompiledText(
                         text=label_text,
                         x=label_x,
@@ -156,14 +164,14 @@ class WaterfallGeom(Geom):
                 )
 
             # Connector line from this bar's top to the next bar's base
-            if i < min(len(categories), len(y_vals)) - 1:
-                next_cx = scales.x.map(categories[i + 1])
-                connector_y = scales.y.map(running)
-                primitives.append(
+            if i < n - 1:
+                next_cx = cx_col[i + 1]
+                connector_y = y_top_px
+                append(
                     CompiledLine(
                         points=[
-                            (cx + bar_width / 2, connector_y),
-                            (next_cx - bar_width / 2, connector_y),
+                            (cx + half_w, connector_y),
+                            (next_cx - half_w, connector_y),
                         ],
                         color=theme.grid_color,
                         width=1.0,
@@ -27,6 +27,7 @@ from __future__ import annotations
 
 import ast
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -56,33 +57,43 @@ _FMT_MARKER_CHARS = set(".,ov^<>1234sp*hH+xXDd|_")
 
 _FMT_LINESTYLES = ["--", "-.", ":", "-"]  # ordered longest-first for matching
 
+# Digits of a CSS-style hex color written without the leading '#'
+_HEX_CHARS = frozenset("0123456789abcdefABCDEF")
 
-def _parse_format_string(fmt: str) -> dict[str, str | None]:
+# File extension at the end of a savefig() path
+_EXT_RE = re.compile(r"\.\w+$")
+
+
+@lru_cache(maxsize=256)
+def _parse_format_string(fmt: str) -> tuple[str | None, str | None, str | None]:
     """Parse a matplotlib format string like 'ro--' into components.
 
-    Returns a dict with keys: color, marker, linestyle (any may be None).
+    Returns a ``(color, marker, linestyle)`` tuple (any may be None).
+    Cached: scripts reuse a handful of format strings across many calls,
+    and the immutable tuple is safe to share between callers.
     """
-    result: dict[str, str | None] = {"color": None, "marker": None, "linestyle": None}
+    color: str | None = None
+    marker: str | None = None
+    linestyle: str | None = None
     remaining = fmt
 
     # Extract color (single char at start)
     if remaining and remaining[0] in _FMT_COLOR_MAP:
-        result["color"] = _FMT_COLOR_MAP[remaining[0]]
+        color = _FMT_COLOR_MAP[remaining[0]]
         remaining = remaining[1:]
 
     # Extract marker (single char)
     if remaining and remaining[0] in _FMT_MARKER_CHARS:
-        result["marker"] = remaining[0]
+        marker = remaining[0]
         remaining = remaining[1:]
 
     # Extract linestyle
     for ls in _FMT_LINESTYLES:
         if remaining.startswith(ls):
-            result["linestyle"] = ls
-            remaining = remaining[len(ls) :]
+            linestyle = ls
             break
 
-    return result
+    return color, marker, linestyle
 
 
 def from_matplotlib(source: str | Path) -> PlotSpec:
@@ -105,6 +116,20 @@ def from_matplotlib(source: str | Path) -> PlotSpec:
     else:
         code = source
 
+    # The cached spec is shared between calls, so hand out a copy: callers
+    # (and Figure setters) are free to mutate what they get back.
+    return _spec_from_code(code).model_copy(deep=True)
+
+
+@lru_cache(maxsize=64)
+def _spec_from_code(code: str) -> PlotSpec:
+    """Parse *code* and extract its PlotSpec.
+
+    Cached on the source text, since the same script is often converted
+    repeatedly (``to_botplotlib_code`` after ``from_matplotlib``, test
+    suites, editor previews); a file is keyed on its current contents, so
+    edits are picked up.
+    """
     tree = ast.parse(code)
     extractor = _MatplotlibExtractor()
     extractor.visit(tree)
@@ -193,7 +218,7 @@ def to_botplotlib_code(source: str | Path) -> str:
             if path.endswith(".png"):
                 lines.append(f'fig.save_png("{path}")')
             else:
-                svg_path = re.sub(r"\.\w+$", ".svg", path)
+                svg_path = _EXT_RE.sub(".svg", path)
                 lines.append(f'fig.save_svg("{svg_path}")')
 
     return "\n".join(lines)
@@ -234,6 +259,11 @@ _NAMED_COLOR_MAP: dict[str, str] = {
 }
 
 
+# Exact-spelling lookup for _normalize_color: single-char format codes and
+# lowercase color names (the key sets do not overlap).
+_EXACT_COLOR_MAP: dict[str, str] = {**_NAMED_COLOR_MAP, **_FMT_COLOR_MAP}
+
+
 def _normalize_color(color_val: Any) -> str | None:
     """Normalize a matplotlib color value to a hex string.
 
@@ -246,23 +276,81 @@ def _normalize_color(color_val: Any) -> str | None:
     if color_val.startswith("#"):
         return color_val
 
-    # Single-char matplotlib code
-    if len(color_val) == 1 and color_val in _FMT_COLOR_MAP:
-        return _FMT_COLOR_MAP[color_val]
+    # Single-char matplotlib code, or a named color already in lowercase
+    # (the usual spelling) — one lookup, no lower() copy.
+    exact = _EXACT_COLOR_MAP.get(color_val)
+    if exact is not None:
+        return exact
 
-    # Named color
-    lower = color_val.lower()
-    if lower in _NAMED_COLOR_MAP:
-        return _NAMED_COLOR_MAP[lower]
+    # Named color in any other case
+    named = _NAMED_COLOR_MAP.get(color_val.lower())
+    if named is not None:
+        return named
 
     # CSS-style hex without #
-    if re.match(r"^[0-9a-fA-F]{6}$", color_val):
+    if len(color_val) == 6 and _HEX_CHARS.issuperset(color_val):
         return f"#{color_val}"
 
     # Return as-is (might be a valid CSS color)
     return color_val
 
 
+# Node types that carry literal plotting arguments: data lists and tuples,
+# format strings, colors, labels and (negative) numbers.
+_LITERAL_NODES = (ast.Constant, ast.List, ast.Tuple, ast.UnaryOp)
+
+
+def _is_plain_literal(node: ast.expr) -> bool:
+    """Return True if *node* is a literal built only from constants.
+
+    Such a subtree holds no calls or assignments, so the extractor can skip
+    walking it.  Cheaper than a NodeVisitor pass over e.g. a long data list.
+    """
+    if isinstance(node, ast.Constant):
+        return True
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        return all(_is_plain_literal(elt) for elt in node.elts)
+    if isinstance(node, ast.UnaryOp):
+        return isinstance(node.operand, ast.Constant)
+    return False
+
+
+# Dotted call name -> _MatplotlibExtractor handler method.  One dict lookup
+# per Call node; most calls in a script (print, np.*, ...) simply miss.
+_CALL_HANDLERS: dict[str, str] = {
+    # Plot types
+    "plt.scatter": "_on_scatter",
+    "ax.scatter": "_on_scatter",
+    "scatter": "_on_scatter",
+    "plt.plot": "_extract_plot_layer",
+    "ax.plot": "_extract_plot_layer",
+    "plot": "_extract_plot_layer",
+    "plt.bar": "_on_bar",
+    "ax.bar": "_on_bar",
+    "bar": "_on_bar",
+    "plt.barh": "_on_bar",
+    "ax.barh": "_on_bar",
+    "barh": "_on_bar",
+    # Labels
+    "plt.title": "_on_title",
+    "ax.set_title": "_on_title",
+    "plt.xlabel": "_on_xlabel",
+    "ax.set_xlabel": "_on_xlabel",
+    "plt.ylabel": "_on_ylabel",
+    "ax.set_ylabel": "_on_ylabel",
+    # Figure configuration
+    "plt.figure": "_extract_figsize",
+    "plt.subplots": "_extract_figsize",
+    # Legend, savefig, grid
+    "plt.legend": "_on_legend",
+    "ax.legend": "_on_legend",
+    "plt.savefig": "_on_savefig",
+    "fig.savefig": "_on_savefig",
+    "plt.grid": "_extract_grid",
+    "ax.grid": "_extract_grid",
+}
+
+
 class _MatplotlibExtractor(ast.NodeVisitor):
     """Walk a matplotlib AST and extract plot spec information."""
 
@@ -282,47 +370,44 @@ class _MatplotlibExtractor(ast.NodeVisitor):
 
     def visit_Call(self, node: ast.Call) -> None:
         func_name = self._get_call_name(node)
-        if func_name is None:
+        handler = _CALL_HANDLERS.get(func_name) if func_name is not None else None
+        if handler is None:
             self.generic_visit(node)
             return
+        getattr(self, handler)(node)
+        # The handler has already read the arguments.  Literal ones (data
+        # lists, strings, numbers) cannot contain calls or assignments, so
+        # only walk the rest, e.g. np.sin(x) or a nested ax.plot(...).
+        # node.func is a plain name or name.attr here: nothing to find.
+        for arg in node.args:
+            if not _is_plain_literal(arg):
+                self.visit(arg)
+        for kw in node.keywords:
+            if not _is_plain_literal(kw.value):
+                self.visit(kw.value)
 
-        # Plot type detection
-        if func_name in ("plt.scatter", "ax.scatter", "scatter"):
-            self._extract_xy_layer(node, "scatter")
-        elif func_name in ("plt.plot", "ax.plot", "plot"):
-            self._extract_plot_layer(node)
-        elif func_name in ("plt.bar", "ax.bar", "bar"):
-            self._extract_xy_layer(node, "bar")
-        elif func_name in ("plt.barh", "ax.barh", "barh"):
-            self._extract_xy_layer(node, "bar")
-
-        # Labels
-        elif func_name in ("plt.title", "ax.set_title"):
-            self.title = self._get_first_str_arg(node)
-        elif func_name in ("plt.xlabel", "ax.set_xlabel"):
-            self.x_label = self._get_first_str_arg(node)
-        elif func_name in ("plt.ylabel", "ax.set_ylabel"):
-            self.y_label = self._get_first_str_arg(node)
-
-        # Figure configuration
-        elif func_name in ("plt.figure",):
-            self._extract_figsize(node)
-        elif func_name in ("plt.subplots",):
-            self._extract_figsize(node)
-
-        # Legend
-        elif func_name in ("plt.legend", "ax.legend"):
-            self.has_legend = True
-
-        # Savefig
-        elif func_name in ("plt.savefig", "fig.savefig"):
-            self.savefig_path = self._get_first_str_arg(node)
-
-        # Grid
-        elif func_name in ("plt.grid", "ax.grid"):
-            self._extract_grid(node)
+    # -- Call handlers (see _CALL_HANDLERS) ------------------------------------
 
-        self.generic_visit(node)
+    def _on_scatter(self, node: ast.Call) -> None:
+        self._extract_xy_layer(node, "scatter")
+
+    def _on_bar(self, node: ast.Call) -> None:
+        self._extract_xy_layer(node, "bar")
+
+    def _on_title(self, node: ast.Call) -> None:
+        self.title = self._get_first_str_arg(node)
+
+    def _on_xlabel(self, node: ast.Call) -> None:
+        self.x_label = self._get_first_str_arg(node)
+
+    def _on_ylabel(self, node: ast.Call) -> None:
+        self.y_label = self._get_first_str_arg(node)
+
+    def _on_legend(self, node: ast.Call) -> None:
+        self.has_legend = True
+
+    def _on_savefig(self, node: ast.Call) -> None:
+        self.savefig_path = self._get_first_str_arg(node)
 
     def visit_Assign(self, node: ast.Assign) -> None:
         """Track simple variable assignments like `x = [1, 2, 3]`."""
@@ -404,24 +489,20 @@ class _MatplotlibExtractor(ast.NodeVisitor):
         # plt.plot(x, y)
 
         args = node.args
-        fmt_info: dict[str, str | None] = {
-            "color": None,
-            "marker": None,
-            "linestyle": None,
-        }
+        color: str | None = None
 
         # Check if the 3rd positional arg is a format string
         if len(args) >= 3:
             fmt_val = self._try_eval_literal(args[2])
             if isinstance(fmt_val, str) and len(fmt_val) <= 4:
-                fmt_info = _parse_format_string(fmt_val)
+                color, _marker, _linestyle = _parse_format_string(fmt_val)
 
         # Extract color from keyword args (overrides format string)
         kw_color = self._get_keyword(node, "color") or self._get_keyword(node, "c")
         if kw_color is not None:
             normalized = _normalize_color(kw_color)
             if normalized:
-                fmt_info["color"] = normalized
+                color = normalized
 
         # Extract label keyword
         label = self._get_keyword(node, "label")
@@ -432,8 +513,8 @@ class _MatplotlibExtractor(ast.NodeVisitor):
         # Attach extra metadata to the last layer
         if self.layers:
             last = self.layers[-1]
-            if fmt_info["color"]:
-                last["color"] = fmt_info["color"]
+            if color:
+                last["color"] = color
             if label:
                 last["label"] = label
 
@@ -529,6 +610,11 @@ class _MatplotlibExtractor(ast.NodeVisitor):
 
     def _try_eval_literal(self, node: ast.expr) -> Any:
         """Try to evaluate an AST node as a literal value."""
+        # Most arguments in real scripts are names (plt.plot(x, y)); reject
+        # anything that is not a literal plotting argument before paying
+        # for literal_eval's raise/catch.
+        if not isinstance(node, _LITERAL_NODES):
+            return None
         try:
             return ast.literal_eval(node)
         except (ValueError, TypeError):
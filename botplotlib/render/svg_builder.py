@@ -15,6 +15,10 @@ from typing import Optional
 
 def _escape_attr(value: str) -> str:
     """Escape a string for use inside an XML attribute value (double-quoted)."""
+    # Nearly every value (numbers, colors, path data) needs no escaping;
+    # plain membership tests skip the chained replace() method calls.
+    if not ("&" in value or "<" in value or ">" in value or '"' in value):
+        return value
     return (
         value.replace("&", "&amp;")
         .replace("<", "&lt;")
@@ -25,6 +29,8 @@ def _escape_attr(value: str) -> str:
 
 def _escape_text(value: str) -> str:
     """Escape a string for use as XML text content."""
+    if not ("&" in value or "<" in value or ">" in value):
+        return value
     return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
@@ -68,35 +74,43 @@ class SvgElement:
 
     def to_string(self, indent: int = 0) -> str:
         """Render the element (and its subtree) as an indented XML string."""
+        out: list[str] = []
+        self._write(out, indent)
+        return "\n".join(out)
+
+    def _write(self, out: list[str], indent: int) -> None:
+        """Append this element's lines to *out*.
+
+        The whole tree shares one line buffer that is joined once at the
+        root, rather than joining a string per subtree on the way back up.
+        """
         pad = "  " * indent
-        parts: list[str] = []
+        tag = self.tag
+        attr_str = _render_attrs(self.attrs)
+
+        if not self.children:
+            if self.text is None:
+                # Self-closing tag
+                out.append(f"{pad}<{tag}{attr_str}/>")
+            else:
+                # Text content (inline, no extra newline)
+                text = _escape_text(self.text)
+                out.append(f"{pad}<{tag}{attr_str}>{text}</{tag}>")
+            return
 
         # Opening tag
-        attr_str = _render_attrs(self.attrs)
-        if self.children or self.text is not None:
-            parts.append(f"{pad}<{self.tag}{attr_str}>")
-        else:
-            # Self-closing tag
-            parts.append(f"{pad}<{self.tag}{attr_str}/>")
-            return "\n".join(parts)
-
-        # Text content (inline, no extra newline)
-        if self.text is not None and not self.children:
-            parts[-1] += _escape_text(self.text)
-            parts[-1] += f"</{self.tag}>"
-            return "\n".join(parts)
+        out.append(f"{pad}<{tag}{attr_str}>")
 
         # Text content before children
         if self.text is not None:
-            parts.append(f"{pad}  {_escape_text(self.text)}")
+            out.append(f"{pad}  {_escape_text(self.text)}")
 
         # Children
         for child in self.children:
-            parts.append(child.to_string(indent + 1))
+            child._write(out, indent + 1)
 
         # Closing tag
-        parts.append(f"{pad}</{self.tag}>")
-        return "\n".join(parts)
+        out.append(f"{pad}</{tag}>")
 
 
 # ---------------------------------------------------------------------------
@@ -149,10 +163,12 @@ class SvgDocument(SvgElement):
 
     def to_string(self, indent: int = 0) -> str:
         """Render complete SVG including the XML declaration."""
-        declaration = '<?xml version="1.0" encoding="UTF-8"?>'
-        comment = "<!-- assembled fresh by botplotlib (a cyborg production) -->"
-        body = super().to_string(indent)
-        return f"{declaration}\n{comment}\n{body}"
+        out = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            "<!-- assembled fresh by botplotlib (a cyborg production) -->",
+        ]
+        self._write(out, indent)
+        return "\n".join(out)
 
 
 # ---------------------------------------------------------------------------
@@ -220,5 +236,6 @@ def polyline(points: list[tuple[float, float]], **attrs: object) -> SvgElement:
 
     *points* is a list of ``(x, y)`` tuples.
     """
-    pts_str = " ".join(f"{x:g},{y:g}" for x, y in points)
+    # join() materializes its input anyway; a list skips the generator.
+    pts_str = " ".join([f"{x:g},{y:g}" for x, y in points])
     return SvgElement("polyline", points=pts_str, **attrs)
@@ -12,6 +12,20 @@ class LinearScale:
     pixel_min: float
     pixel_max: float
 
+    def coefficients(self) -> tuple[float, float, float]:
+        """Return ``(data_min, pixel_min, k)`` for mapping whole columns.
+
+        ``pixel_min + (v - data_min) * k`` maps *v* like map() does, with
+        only the ratio ``k`` hoisted.  Geoms use this to map a column inline
+        instead of paying a method call per value.  Offsetting by
+        ``data_min`` first keeps precision when the data sits far from zero
+        (e.g. timestamps), where a slope/intercept form would cancel.
+        """
+        if self.data_max == self.data_min:
+            return self.data_min, (self.pixel_min + self.pixel_max) / 2, 0.0
+        k = (self.pixel_max - self.pixel_min) / (self.data_max - self.data_min)
+        return self.data_min, self.pixel_min, k
+
     def map(self, value: float) -> float:
         """Map a data value to pixel position."""
         if self.data_max == self.data_min:
@@ -35,6 +49,19 @@ class CategoricalScale:
     pixel_min: float
     pixel_max: float
 
+    def positions(self) -> dict[str, float]:
+        """Return ``{category: center pixel}`` for every category.
+
+        Lets geoms map a whole column with dict lookups instead of an
+        O(categories) ``list.index`` per value.
+        """
+        band_width = self.band_width
+        table: dict[str, float] = {}
+        for idx, category in enumerate(self.categories):
+            # First occurrence wins, matching list.index() in map().
+            table.setdefault(category, self.pixel_min + band_width * (idx + 0.5))
+        return table
+
     def map(self, category: str) -> float:
         """Map a category to its center pixel position."""
         idx = self.categories.index(category)
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
+import pytest
+
 import botplotlib as blt
 from botplotlib.figure import Figure
 from botplotlib.spec.models import PlotSpec
@@ -108,6 +112,17 @@ class TestPlot:
         assert_valid_svg(fig.to_svg())
 
 
+class TestSpecIsolation:
+    def test_figures_do_not_share_sub_specs(self) -> None:
+        data = {"x": [1, 2, 3], "y": [4, 5, 6]}
+        fig1 = blt.scatter(data, x="x", y="y")
+        fig2 = blt.scatter(data, x="x", y="y")
+        fig1.spec.size.width = 400
+        fig1.spec.legend.position = "top"
+        assert fig2.spec.size.width == 800
+        assert fig2.spec.legend.position == "right"
+
+
 class TestRender:
     def test_render_from_spec(self) -> None:
         from botplotlib.spec.models import DataSpec, LabelsSpec, LayerSpec
@@ -144,3 +159,78 @@ class TestReprSvg:
         )
         repr_svg = fig._repr_svg_()
         assert repr_svg == fig.to_svg()
+
+
+class TestLazyImport:
+    def _run(self, code: str) -> str:
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip()
+
+    def test_import_does_not_load_pydantic(self) -> None:
+        code = "import sys, botplotlib; print('pydantic' in sys.modules)"
+        assert self._run(code) == "False"
+
+    def test_render_function_survives_subpackage_import(self) -> None:
+        code = (
+            "import botplotlib.render.svg_renderer, botplotlib as blt; "
+            "print(callable(blt.render))"
+        )
+        assert self._run(code) == "True"
+
+    def test_render_has_both_meanings(self) -> None:
+        code = (
+            "import sys, types, botplotlib as blt; "
+            "from botplotlib.render.svg_builder import SvgDocument; "
+            "print(isinstance(blt.render, types.FunctionType), "
+            "hasattr(sys.modules['botplotlib.render'], '__path__'))"
+        )
+        assert self._run(code) == "True True"
+
+    def test_render_type_hints_resolve(self) -> None:
+        code = (
+            "import typing, botplotlib as blt; "
+            "hints = typing.get_type_hints(blt.render); "
+            "print(hints['spec'] is blt.PlotSpec, hints['return'] is blt.Figure)"
+        )
+        assert self._run(code) == "True True"
+
+    @pytest.mark.parametrize("name", ["spec", "figure", "compiler", "geoms"])
+    def test_subpackages_resolve_as_attributes(self, name: str) -> None:
+        code = (
+            "import botplotlib as blt; "
+            f"print(blt.{name}.__name__, blt.{name} is blt.{name})"
+        )
+        assert self._run(code) == f"botplotlib.{name} True"
+
+    def test_unknown_attribute_raises(self) -> None:
+        with pytest.raises(AttributeError, match="no_such_thing"):
+            blt.no_such_thing
+        assert not hasattr(blt, "__no_such_dunder__")
+
+    def test_unknown_attribute_does_not_import(self) -> None:
+        code = (
+            "import sys, botplotlib as blt; "
+            "print(hasattr(blt, '_api'), 'botplotlib._api' in sys.modules)"
+        )
+        assert self._run(code) == "False False"
+
+
+class TestSetterInvalidation:
+    def test_same_value_keeps_cached_svg(self) -> None:
+        fig = blt.scatter({"x": [1, 2], "y": [3, 4]}, x="x", y="y", title="Same")
+        svg = fig.to_svg()
+        fig.title = "Same"
+        fig.subtitle = None
+        fig.footnote = None
+        assert fig._svg is svg
+
+    def test_new_value_invalidates(self) -> None:
+        fig = blt.scatter({"x": [1, 2], "y": [3, 4]}, x="x", y="y", title="Old")
+        fig.to_svg()
+        fig.title = "New"
+        assert fig._svg is None
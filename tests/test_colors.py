@@ -7,10 +7,13 @@ import re
 import pytest
 
 from botplotlib._colors.palettes import (
+    _SRGB_LIN,
     DEFAULT_PALETTE,
+    _linearize,
     assign_colors,
     contrast_ratio,
     hex_to_rgb,
+    luminance_ratio,
     relative_luminance,
     rgb_to_hex,
 )
@@ -48,6 +51,13 @@ class TestHexToRgb:
         with pytest.raises(ValueError):
             hex_to_rgb("#12345")
 
+    @pytest.mark.parametrize(
+        "bad", ["0x1234", "#12_345", "#-12345", "#+12345", "# 12345", "#GGHHII"]
+    )
+    def test_non_hex_digits_raise(self, bad: str) -> None:
+        with pytest.raises(ValueError, match="Invalid hex color"):
+            hex_to_rgb(bad)
+
 
 # ---------------------------------------------------------------------------
 # rgb_to_hex
@@ -134,6 +144,24 @@ class TestAssignColors:
         result = assign_colors(groups, palette=None)
         assert result["only"] == DEFAULT_PALETTE[0]
 
+    def test_raw_values_are_stringified(self) -> None:
+        result = assign_colors([2020, 2021, 2020, None])
+        assert list(result.keys()) == ["2020", "2021", "None"]
+
+    def test_equal_hash_values_stay_distinct(self) -> None:
+        result = assign_colors([1, 1.0, True, "1"])
+        assert list(result.keys()) == ["1", "1.0", "True"]
+
+    def test_equal_values_with_different_strings_stay_distinct(self) -> None:
+        from decimal import Decimal
+
+        result = assign_colors([0.0, -0.0, Decimal("1.0"), Decimal("1.00")])
+        assert list(result.keys()) == ["0.0", "-0.0", "1.0", "1.00"]
+
+    def test_unhashable_values(self) -> None:
+        result = assign_colors([[1], [2], [1]])
+        assert list(result.keys()) == ["[1]", "[2]"]
+
 
 # ---------------------------------------------------------------------------
 # relative_luminance
@@ -166,6 +194,10 @@ class TestRelativeLuminance:
         lum = relative_luminance("#0000FF")
         assert lum == pytest.approx(0.0722, abs=1e-4)
 
+    def test_lookup_table_matches_formula(self) -> None:
+        for c in range(256):
+            assert _SRGB_LIN[c] == _linearize(c / 255.0)
+
 
 # ---------------------------------------------------------------------------
 # contrast_ratio
@@ -192,6 +224,23 @@ class TestContrastRatio:
         ratio = contrast_ratio("#4E79A7", "#F28E2B")
         assert 1.0 <= ratio <= 21.0
 
+    def test_luminance_ratio_matches(self) -> None:
+        l1 = relative_luminance("#4E79A7")
+        l2 = relative_luminance("#FFFFFF")
+        assert luminance_ratio(l1, l2) == contrast_ratio("#4E79A7", "#FFFFFF")
+        assert luminance_ratio(l2, l1) == luminance_ratio(l1, l2)
+
+    def test_repeated_pairs_hit_cache(self) -> None:
+        contrast_ratio.cache_clear()
+        contrast_ratio("#333333", "#FFFFFF")
+        contrast_ratio("#333333", "#FFFFFF")
+        assert contrast_ratio.cache_info().hits == 1
+
+    def test_invalid_color_still_raises_on_repeat(self) -> None:
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                contrast_ratio("#12345", "#FFFFFF")
+
 
 # ---------------------------------------------------------------------------
 # DEFAULT_PALETTE validation
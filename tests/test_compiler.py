@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
-from botplotlib.compiler.compiler import CompiledPlot, compile_spec
+import pytest
+
+import botplotlib.compiler.compiler as compiler_mod
+from botplotlib.compiler.compiler import (
+    CompiledBar,
+    CompiledPlot,
+    CompiledPoint,
+    CompiledText,
+    compile_spec,
+)
 from botplotlib.spec.models import (
     DataSpec,
     LabelsSpec,
@@ -98,6 +107,21 @@ class TestCompileLine:
         result = compile_spec(_make_line_spec())
         assert len(result.lines[0].points) == 4
 
+    def test_color_groups_keep_first_seen_order(self) -> None:
+        spec = PlotSpec(
+            data=DataSpec(
+                columns={
+                    "x": [1, 2, 3, 4, 5],
+                    "y": [1, 2, 3, 4, 5],
+                    "g": ["b", "a", "b", "a", "b"],
+                }
+            ),
+            layers=[LayerSpec(geom="line", x="x", y="y", color="g")],
+        )
+        result = compile_spec(spec)
+        assert [ln.group for ln in result.lines] == ["b", "a"]
+        assert [len(ln.points) for ln in result.lines] == [3, 2]
+
 
 class TestCompileBar:
     def test_produces_bars(self) -> None:
@@ -140,3 +164,149 @@ class TestCompileEmptySpec:
         assert len(result.points) == 0
         assert len(result.lines) == 0
         assert len(result.bars) == 0
+
+
+class TestTickCollisionPass:
+    def test_disabled_pass_skips_collision_work(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def _fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("avoid_collisions should not run")
+
+        monkeypatch.setattr(compiler_mod, "avoid_collisions", _fail)
+        compile_spec(_make_bar_spec())
+
+
+class TestTickOrder:
+    def test_numeric_x_ticks_ascending(self) -> None:
+        result = compile_spec(_make_scatter_spec())
+        positions = [t.pixel_pos for t in result.x_ticks]
+        assert positions == sorted(positions)
+
+    def test_categorical_x_ticks_ascending(self) -> None:
+        result = compile_spec(_make_bar_spec())
+        positions = [t.pixel_pos for t in result.x_ticks]
+        assert positions == sorted(positions)
+
+
+class TestCategoricalScaleHints:
+    def test_bar_hint_categories_are_unique(self) -> None:
+        from botplotlib.geoms import get_geom
+
+        layer = LayerSpec(geom="bar", x="c", y="v")
+        data = {"c": ["A", "B", "A", 1, "1"], "v": [1, 2, 3, 4, 5]}
+        hint = get_geom("bar").scale_hint(layer, data)
+        assert hint.x_categories == ["A", "B", "1"]
+
+
+class TestGeomRequireColumns:
+    @pytest.mark.parametrize("geom", ["scatter", "line", "bar", "waterfall"])
+    def test_error_names_geom_and_role(self, geom: str) -> None:
+        from botplotlib.geoms import get_geom
+
+        layer = LayerSpec(geom=geom, x="category", y="amount")
+        with pytest.raises(
+            ValueError,
+            match=rf"^{geom.capitalize()} geom requires column 'amount' for y axis, "
+            r"but data has columns: \['category'\]\.$",
+        ):
+            get_geom(geom).validate(layer, {"category": ["A"]})
+
+
+class TestCoerceNumeric:
+    def test_numeric_column(self) -> None:
+        from botplotlib.geoms import coerce_numeric
+
+        assert coerce_numeric([1, 2.5, "3"]) == [1.0, 2.5, 3.0]
+
+    def test_mixed_column_drops_non_numeric(self) -> None:
+        from botplotlib.geoms import coerce_numeric
+
+        assert coerce_numeric([1, None, "x", 4, "5.5"]) == [1.0, 4.0, 5.5]
+
+    def test_scatter_hint_skips_bad_cells(self) -> None:
+        from botplotlib.geoms import get_geom
+
+        layer = LayerSpec(geom="scatter", x="x", y="y")
+        data = {"x": [1, "n/a", 3], "y": [None, 2, 4]}
+        hint = get_geom("scatter").scale_hint(layer, data)
+        assert hint.x_numeric == [1.0, 3.0]
+        assert hint.y_numeric == [2.0, 4.0]
+
+
+class TestExtent:
+    @pytest.mark.parametrize(
+        "values",
+        [[3.0], [2.0, -1.0, 5.0, 0.5], [1.0, float("nan"), -2.0], [0.0, -0.0]],
+    )
+    def test_matches_min_max(self, values: list[float]) -> None:
+        assert compiler_mod._extent(values) == (min(values), max(values))
+
+    def test_skips_leading_nan(self) -> None:
+        assert compiler_mod._extent([float("nan"), 50.0, 40.0]) == (40.0, 50.0)
+
+    def test_all_nan_is_none(self) -> None:
+        assert compiler_mod._extent([float("nan"), float("nan")]) is None
+
+    def test_nan_in_one_layer_keeps_other_layers_range(self) -> None:
+        spec = PlotSpec(
+            data=DataSpec(
+                columns={
+                    "x": [1, 2, 3],
+                    "a": [1, 2, 1.5],
+                    "b": [float("nan"), 50, 40],
+                }
+            ),
+            layers=[
+                LayerSpec(geom="line", x="x", y="a"),
+                LayerSpec(geom="line", x="x", y="b"),
+            ],
+        )
+        values = [t.value for t in compile_spec(spec).y_ticks]
+        assert values[0] <= 1
+        assert values[-1] >= 50
+
+
+class TestPrimitiveLayout:
+    def test_primitives_are_slotted(self) -> None:
+        prims = [
+            CompiledPoint(1.0, 2.0, "#000000", 4.0),
+            CompiledBar(1.0, 2.0, 3.0, 4.0, "#000000"),
+            CompiledText("a", 1.0, 2.0, 10, "#000000"),
+        ]
+        for prim in prims:
+            assert not hasattr(prim, "__dict__")
+
+    def test_add_primitives_matches_add_primitive(self) -> None:
+        from botplotlib._types import Rect
+        from botplotlib.geoms.primitives import CompiledPath
+        from botplotlib.spec.theme import DEFAULT_THEME
+
+        prims = [
+            CompiledBar(1.0, 2.0, 3.0, 4.0, "#000000"),
+            CompiledPoint(1.0, 2.0, "#000000", 4.0),
+            CompiledPath("M0 0"),
+            CompiledText("a", 1.0, 2.0, 10, "#000000"),
+            CompiledPoint(3.0, 4.0, "#000000", 4.0),
+        ]
+        one = CompiledPlot(10, 10, DEFAULT_THEME, Rect(0, 0, 10, 10))
+        for prim in prims:
+            one.add_primitive(prim)
+        bulk = CompiledPlot(10, 10, DEFAULT_THEME, Rect(0, 0, 10, 10))
+        bulk.add_primitives(prims)
+        assert bulk == one
+
+    def test_add_primitive_routes_subclasses(self) -> None:
+        from dataclasses import dataclass
+
+        from botplotlib._types import Rect
+        from botplotlib.spec.theme import DEFAULT_THEME
+
+        @dataclass(slots=True)
+        class TaggedPoint(CompiledPoint):
+            tag: str = ""
+
+        plot = CompiledPlot(10, 10, DEFAULT_THEME, Rect(0, 0, 10, 10))
+        plot.add_primitive(TaggedPoint(1.0, 2.0, "#000000", 4.0, tag="t"))
+        assert len(plot.points) == 1
+        assert plot.primitives == plot.points
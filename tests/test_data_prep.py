@@ -49,6 +49,12 @@ class TestListOfDicts:
         assert result["x"] == [1, 3]
         assert result["y"] == [2, None]
 
+    def test_late_keys_backfilled_in_first_seen_order(self) -> None:
+        data = [{"x": 1}, {"y": 2, "x": 3}, {"z": 4}]
+        result = normalize_data(data)
+        assert list(result) == ["x", "y", "z"]
+        assert result == {"x": [1, 3, None], "y": [None, 2, None], "z": [None, None, 4]}
+
     def test_list_of_non_dicts_raises(self) -> None:
         with pytest.raises(TypeError, match="list of dicts"):
             normalize_data([1, 2, 3])
@@ -96,3 +102,36 @@ class TestUnsupported:
     def test_none_raises(self) -> None:
         with pytest.raises(TypeError, match="Can't make a plot from"):
             normalize_data(None)
+
+
+class TestDictSubclasses:
+    """Subclasses miss the exact-type fast path but still normalize."""
+
+    def test_ordered_dict(self) -> None:
+        from collections import OrderedDict
+
+        data = OrderedDict([("x", [1, 2]), ("y", (3, 4))])
+        assert normalize_data(data) == {"x": [1, 2], "y": [3, 4]}
+
+    def test_list_subclass_of_records(self) -> None:
+        class Records(list):
+            pass
+
+        data = Records([{"x": 1}, {"x": 2}])
+        assert normalize_data(data) == {"x": [1, 2]}
+
+
+class TestIterators:
+    """Non-generator iterators take the generator path too."""
+
+    def test_plain_iterator_of_dicts(self) -> None:
+        data = iter([{"x": 1, "y": 4}, {"x": 2, "y": 5}])
+        assert normalize_data(data) == {"x": [1, 2], "y": [4, 5]}
+
+    def test_non_dict_stream_fails_before_materializing(self) -> None:
+        def gen():
+            yield 1
+            raise AssertionError("stream should not be consumed further")
+
+        with pytest.raises(TypeError, match="Generator yielded int"):
+            normalize_data(gen())
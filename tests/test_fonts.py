@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 
 from botplotlib._fonts.metrics import (
+    _ascii_width_table,
     _load_font_table,
     text_bbox,
     text_height,
@@ -90,6 +91,31 @@ class TestTextWidth:
         assert isinstance(result, float)
         assert result > 0
 
+    def test_ascii_fast_path_matches_table(self) -> None:
+        table = _load_font_table("arial")
+        text = "Revenue (Q3) $1,234.5\t"
+        expected = sum(table.get(ch, 0.5) for ch in text) * 12
+        assert text_width(text, font_size=12) == expected
+
+    def test_repeated_labels_hit_cache(self) -> None:
+        text_width.cache_clear()
+        for _ in range(3):
+            text_width("100", 10, "arial")
+        assert text_width.cache_info().hits == 2
+
+    @pytest.mark.parametrize("font_name", ["arial", "inter"])
+    def test_ascii_table_covers_every_code_point(self, font_name: str) -> None:
+        table = _load_font_table(font_name)
+        widths = _ascii_width_table(font_name)
+        assert len(widths) == 128
+        for cp in range(128):
+            assert widths[cp] == table.get(chr(cp), 0.5)
+
+    def test_mixed_ascii_and_non_ascii(self) -> None:
+        assert text_width("a\u2603", font_size=10) == pytest.approx(
+            text_width("a", font_size=10) + 0.5 * 10
+        )
+
 
 # ---------------------------------------------------------------------------
 # text_height
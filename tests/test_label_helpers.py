@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from botplotlib.geoms.labels import format_label, label_fits_inside
+import pytest
+
+from botplotlib.geoms.labels import (
+    format_label,
+    inside_label_color,
+    label_fits_inside,
+)
 
 
 class TestFormatLabel:
@@ -29,6 +35,10 @@ class TestFormatLabel:
     def test_custom_decimal_format(self) -> None:
         assert format_label(3.14159, "{:.2f}") == "3.14"
 
+    def test_non_finite_value(self) -> None:
+        assert format_label(float("inf")) == "inf"
+        assert format_label(float("-inf")) == "-inf"
+
 
 class TestLabelFitsInside:
     """label_fits_inside() placement decision."""
@@ -56,3 +66,26 @@ class TestLabelFitsInside:
             bar_height=15,
             padding=10.0,
         )
+
+
+class TestInsideLabelColor:
+    """inside_label_color() contrast choice."""
+
+    def test_dark_fill_gets_white(self) -> None:
+        assert inside_label_color("#1A1A1A", "#333333") == "#FFFFFF"
+
+    def test_light_fill_keeps_text_color(self) -> None:
+        assert inside_label_color("#F0E68C", "#333333") == "#333333"
+
+
+class TestLabelFitsInsideOrder:
+    """Short bars are rejected before any text measurement."""
+
+    def test_short_bar_skips_text_width(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import botplotlib.geoms.labels as labels_mod
+
+        def _fail(*args: object) -> float:
+            raise AssertionError("text_width should not be called")
+
+        monkeypatch.setattr(labels_mod, "text_width", _fail)
+        assert not label_fits_inside("123", 12.0, bar_width=100.0, bar_height=5.0)
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import dataclasses
+
+import pytest
+
+from botplotlib._types import Rect
 from botplotlib.compiler.layout import (
     TextLabel,
     avoid_collisions,
@@ -59,6 +64,26 @@ class TestComputeLayout:
         assert result.title_pos is None
 
 
+class TestRectIntersects:
+    """Tests for Rect edges and the intersection kernel."""
+
+    def test_edges_are_precomputed(self) -> None:
+        r = Rect(10, 20, 30, 40)
+        assert (r.right, r.bottom) == (40, 60)
+
+    def test_disjoint_on_x(self) -> None:
+        assert not Rect(0, 0, 10, 10).intersects(Rect(20, 0, 10, 10))
+
+    def test_disjoint_on_y(self) -> None:
+        assert not Rect(0, 0, 10, 10).intersects(Rect(0, 20, 10, 10))
+
+    def test_touching_edges_do_not_intersect(self) -> None:
+        assert not Rect(0, 0, 10, 10).intersects(Rect(10, 0, 10, 10))
+
+    def test_overlapping(self) -> None:
+        assert Rect(0, 0, 10, 10).intersects(Rect(5, 5, 10, 10))
+
+
 class TestAvoidCollisions:
     """Tests for the ggrepel-style collision avoidance."""
 
@@ -92,3 +117,25 @@ class TestAvoidCollisions:
         result = avoid_collisions(labels)
         # They should be nudged apart
         assert result[0].y != result[1].y
+
+    def test_only_x_overlapping_labels_move(self) -> None:
+        labels = [
+            TextLabel("Label A", 100, 100, 12),
+            TextLabel("Label B", 400, 100, 12),
+            TextLabel("Label C", 102, 100, 12),
+        ]
+        result = avoid_collisions(labels)
+        assert result[1].y == 100
+        assert result[0].y < 100 < result[2].y
+
+
+class TestComputeLayoutCache:
+    def test_repeat_calls_share_result(self) -> None:
+        first = compute_layout(640, 480, 40, 20, 50, 60, has_title=True)
+        second = compute_layout(640, 480, 40, 20, 50, 60, has_title=True)
+        assert first is second
+
+    def test_result_is_immutable(self) -> None:
+        result = compute_layout(640, 480, 40, 20, 50, 60)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.canvas_width = 1  # type: ignore[misc]
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import ast
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from botplotlib.refactor.from_matplotlib import (
+    _MatplotlibExtractor,
     _normalize_color,
     _parse_format_string,
     from_matplotlib,
@@ -216,31 +220,38 @@ class TestFormatStringParsing:
     """Test matplotlib format string parsing (e.g., 'ro-', 'b--')."""
 
     def test_parse_color_only(self) -> None:
-        result = _parse_format_string("r")
-        assert result["color"] == "#d62728"
-        assert result["marker"] is None
-        assert result["linestyle"] is None
+        assert _parse_format_string("r") == ("#d62728", None, None)
 
     def test_parse_color_and_marker(self) -> None:
-        result = _parse_format_string("ro")
-        assert result["color"] == "#d62728"
-        assert result["marker"] == "o"
+        color, marker, _linestyle = _parse_format_string("ro")
+        assert color == "#d62728"
+        assert marker == "o"
 
     def test_parse_color_marker_linestyle(self) -> None:
-        result = _parse_format_string("ro-")
-        assert result["color"] == "#d62728"
-        assert result["marker"] == "o"
-        assert result["linestyle"] == "-"
+        assert _parse_format_string("ro-") == ("#d62728", "o", "-")
 
     def test_parse_dashed_line(self) -> None:
-        result = _parse_format_string("b--")
-        assert result["color"] == "#1f77b4"
-        assert result["linestyle"] == "--"
+        color, _marker, linestyle = _parse_format_string("b--")
+        assert color == "#1f77b4"
+        assert linestyle == "--"
 
     def test_parse_marker_only(self) -> None:
-        result = _parse_format_string("^")
-        assert result["color"] is None
-        assert result["marker"] == "^"
+        color, marker, _linestyle = _parse_format_string("^")
+        assert color is None
+        assert marker == "^"
+
+    def test_format_color_kwarg_overrides(self) -> None:
+        code = """
+import matplotlib.pyplot as plt
+plt.plot([1, 2], [3, 4], 'r--')
+plt.plot([1, 2], [3, 4], 'r--', color='blue')
+"""
+        extractor = _MatplotlibExtractor()
+        extractor.visit(ast.parse(code))
+        assert [layer["color"] for layer in extractor.layers] == [
+            "#d62728",
+            "#1F77B4",
+        ]
 
     def test_plot_with_format_string(self) -> None:
         code = """
@@ -283,6 +294,25 @@ class TestNormalizeColor:
     def test_single_char_code(self) -> None:
         assert _normalize_color("r") == "#d62728"
 
+    def test_bare_hex_gets_hash(self) -> None:
+        assert _normalize_color("ff8800") == "#ff8800"
+        assert _normalize_color("FF8800") == "#FF8800"
+
+    def test_not_quite_hex_passes_through(self) -> None:
+        for val in ("ff880", "ff88000", "gg8800", "ff8800\n"):
+            assert _normalize_color(val) == val
+
+    def test_single_char_code_is_case_sensitive(self) -> None:
+        assert _normalize_color("R") == "R"
+
+    def test_fmt_codes_and_names_do_not_overlap(self) -> None:
+        from botplotlib.refactor.from_matplotlib import (
+            _FMT_COLOR_MAP,
+            _NAMED_COLOR_MAP,
+        )
+
+        assert not _FMT_COLOR_MAP.keys() & _NAMED_COLOR_MAP.keys()
+
     def test_non_string_returns_none(self) -> None:
         assert _normalize_color(42) is None
         assert _normalize_color(None) is None
@@ -690,3 +720,92 @@ plt.scatter([1, 2, 3], [4, 5, 6])
         result = to_botplotlib_code(code)
         assert "width=1200" in result
         assert "height=800" in result
+
+
+# ============================================================================
+# Parse cache
+# ============================================================================
+
+
+class TestParseCache:
+    """Repeated conversions reuse the parsed spec without sharing it."""
+
+    CODE = """
+import matplotlib.pyplot as plt
+plt.plot([1, 2, 3], [4, 5, 6])
+plt.title("Cached")
+"""
+
+    def test_second_conversion_hits_cache(self) -> None:
+        from botplotlib.refactor.from_matplotlib import _spec_from_code
+
+        _spec_from_code.cache_clear()
+        from_matplotlib(self.CODE)
+        from_matplotlib(self.CODE)
+        assert _spec_from_code.cache_info().hits == 1
+
+    def test_returned_specs_are_independent(self) -> None:
+        first = from_matplotlib(self.CODE)
+        first.labels.title = "Changed"
+        first.data.columns["x"].append(99)
+        second = from_matplotlib(self.CODE)
+        assert second.labels.title == "Cached"
+        assert second.data.columns["x"] == [1, 2, 3]
+
+    def test_edited_file_is_reparsed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "plot.py"
+            path.write_text(self.CODE)
+            assert from_matplotlib(path).labels.title == "Cached"
+            path.write_text(self.CODE.replace("Cached", "Edited"))
+            assert from_matplotlib(path).labels.title == "Edited"
+
+
+class TestCallDispatch:
+    """The call-name dispatch table stays in sync with the extractor."""
+
+    def test_every_handler_exists(self) -> None:
+        from botplotlib.refactor.from_matplotlib import _CALL_HANDLERS
+
+        for name, handler in _CALL_HANDLERS.items():
+            assert callable(getattr(_MatplotlibExtractor, handler, None)), name
+
+    def test_calls_nested_in_handled_calls_are_found(self) -> None:
+        code = """
+import matplotlib.pyplot as plt
+plt.legend(handles=[plt.scatter([1, 2], [3, 4])])
+plt.title(str(plt.bar(["a", "b"], [1, 2])))
+"""
+        spec = from_matplotlib(code)
+        assert [layer.geom for layer in spec.layers] == ["scatter", "bar"]
+        assert spec.legend.show
+
+    def test_unrelated_calls_are_ignored(self) -> None:
+        code = """
+import matplotlib.pyplot as plt
+print("hello")
+plt.show()
+plt.scatter([1, 2], [3, 4])
+"""
+        spec = from_matplotlib(code)
+        assert [layer.geom for layer in spec.layers] == ["scatter"]
+
+
+class TestLiteralPrecheck:
+    """The literal pre-check only admits literal plotting arguments."""
+
+    @pytest.mark.parametrize("src", ["[1, 2]", "(1, 'a')", "-3", "'r--'", "[-1.5, 2]"])
+    def test_plotting_literals_are_evaluated(self, src: str) -> None:
+        from botplotlib.refactor.from_matplotlib import _MatplotlibExtractor
+
+        node = ast.parse(src, mode="eval").body
+        assert _MatplotlibExtractor()._try_eval_literal(node) == ast.literal_eval(node)
+
+    @pytest.mark.parametrize(
+        "src", ["x", "a.b", "a[0]", "f(1)", "-x", "[x, 1]", "{'a': 1}", "set()"]
+    )
+    def test_other_nodes_are_rejected(self, src: str) -> None:
+        from botplotlib.refactor.from_matplotlib import _MatplotlibExtractor
+
+        node = ast.parse(src, mode="eval").body
+        assert _MatplotlibExtractor()._try_eval_literal(node) is None
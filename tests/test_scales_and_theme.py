@@ -30,6 +30,40 @@ class TestLinearScale:
         scale = LinearScale(data_min=5, data_max=5, pixel_min=100, pixel_max=300)
         assert scale.map(5) == 200.0
 
+    def test_coefficients_match_map(self):
+        """pixel_min + (v - data_min) * k reproduces map()."""
+        scale = LinearScale(data_min=-3, data_max=17, pixel_min=450, pixel_max=40)
+        d0, p0, k = scale.coefficients()
+        for value in [-3, 0, 2.5, 17]:
+            assert p0 + (value - d0) * k == pytest.approx(scale.map(value))
+
+    def test_coefficients_keep_precision_far_from_zero(self):
+        """Timestamp-like data maps onto the same pixels as map()."""
+        lo, span = 9661431320437.264, 1.8776197368550083
+        scale = LinearScale(lo, lo + span, pixel_min=80, pixel_max=760)
+        d0, p0, k = scale.coefficients()
+        for value in [lo, 9661431320438.47, lo + span]:
+            assert p0 + (value - d0) * k == pytest.approx(scale.map(value), abs=1e-6)
+
+    def test_map_endpoints_are_exact(self):
+        """map() hits the pixel bounds exactly, with no rounding drift."""
+        scale = LinearScale(data_min=0.1, data_max=0.7, pixel_min=450, pixel_max=40)
+        assert scale.map(0.1) == 450
+        assert scale.map(0.7) == 40
+
+    def test_coefficients_equal_data_min_max(self):
+        """A degenerate scale maps everything to the pixel center."""
+        scale = LinearScale(data_min=5, data_max=5, pixel_min=100, pixel_max=300)
+        assert scale.coefficients() == (5, 200.0, 0.0)
+
+    def test_reassigned_bound_updates_map(self):
+        """map() and coefficients() follow later field changes."""
+        scale = LinearScale(data_min=0, data_max=100, pixel_min=0, pixel_max=500)
+        scale.data_max = 50
+        assert scale.map(50) == 500.0
+        assert scale.coefficients() == (0, 0, 10.0)
+        assert scale == LinearScale(0, 50, 0, 500)
+
     def test_invert_round_trip(self):
         """Mapping then inverting returns the original value."""
         scale = LinearScale(data_min=10, data_max=50, pixel_min=0, pixel_max=400)
@@ -66,6 +100,20 @@ class TestCategoricalScale:
         )
         assert scale.band_width == pytest.approx(100.0)
 
+    def test_positions_match_map(self):
+        """positions() agrees with map() for every category."""
+        scale = CategoricalScale(categories=["A", "B", "C"], pixel_min=7, pixel_max=95)
+        assert scale.positions() == {c: scale.map(c) for c in scale.categories}
+
+    def test_map_column_unknown_category_raises(self):
+        """Column mapping keeps map()'s ValueError for unknown categories."""
+        from botplotlib.geoms import map_column
+
+        scale = CategoricalScale(categories=["A", "B"], pixel_min=0, pixel_max=200)
+        assert map_column(scale, ["B", "A"]) == [150.0, 50.0]
+        with pytest.raises(ValueError):
+            map_column(scale, ["A", "Z"])
+
     def test_map_unknown_category_raises(self):
         """Mapping an unknown category raises ValueError."""
         scale = CategoricalScale(categories=["A", "B"], pixel_min=0, pixel_max=200)
@@ -72,6 +72,21 @@ class TestSvgElement:
         output = el.to_string()
         assert "say &quot;hello&quot; &amp; &lt;bye&gt;" in output
 
+    def test_single_special_char_escaped(self) -> None:
+        from botplotlib.render.svg_builder import _escape_attr, _escape_text
+
+        assert _escape_attr('a"b') == "a&quot;b"
+        assert _escape_attr("a>b") == "a&gt;b"
+        assert _escape_text("a>b") == "a&gt;b"
+        assert _escape_text('a"b') == 'a"b'
+
+    def test_plain_values_returned_unchanged(self) -> None:
+        from botplotlib.render.svg_builder import _escape_attr, _escape_text
+
+        value = "M205.508 51.1226H233.532"
+        assert _escape_attr(value) is value
+        assert _escape_text(value) is value
+
     def test_add_returns_child(self) -> None:
         parent = SvgElement("g")
         child = SvgElement("rect")
@@ -59,6 +59,12 @@ class TestNiceNum:
     def test_round_down_large(self) -> None:
         assert nice_num(750.0, round_down=True) == 500.0
 
+    def test_decade_table_edges(self) -> None:
+        # Inside, at the edge of, and beyond the precomputed decades.
+        assert nice_num(3e-30) == pytest.approx(5e-30)
+        assert nice_num(1.5e30) == pytest.approx(2e30)
+        assert nice_num(7e40) == pytest.approx(1e41)
+
     def test_rejects_zero(self) -> None:
         with pytest.raises(ValueError):
             nice_num(0)
@@ -144,6 +150,27 @@ class TestNiceTicks:
         assert ticks[0] <= 0
         assert ticks[-1] >= 1_000_000
 
+    def test_whole_spacing_ticks_are_integral(self) -> None:
+        ticks = nice_ticks(-37, 9_412)
+        assert all(isinstance(t, float) and t.is_integer() for t in ticks)
+
+    def test_no_accumulated_drift(self) -> None:
+        # Tiny spacing on a large offset: summing the step used to leak
+        # float noise into the later ticks (…838999 instead of …839).
+        ticks = nice_ticks(2457828.257838806, 2457828.2578390543, 8)
+        assert ticks[4] == 2457828.257839
+        assert ticks[-1] == 2457828.2578391
+
+    def test_results_are_cached_but_not_shared(self) -> None:
+        from botplotlib.compiler.ticks import _nice_ticks
+
+        _nice_ticks.cache_clear()
+        first = nice_ticks(0, 937)
+        first.append(-1.0)
+        second = nice_ticks(0, 937)
+        assert _nice_ticks.cache_info().hits == 1
+        assert -1.0 not in second
+
 
 # ---------------------------------------------------------------------------
 # format_tick
@@ -180,3 +207,7 @@ class TestFormatTick:
 
     def test_large_integer(self) -> None:
         assert format_tick(10000.0) == "10000"
+
+    def test_non_finite(self) -> None:
+        assert format_tick(float("inf")) == "inf"
+        assert format_tick(float("nan")) == "nan"
@@ -120,11 +120,26 @@ class TestWaterfallCompilation:
         for h in bar_heights:
             assert h > 0
 
+    def test_connectors_sit_on_running_totals(self) -> None:
+        compiled = self._compile_waterfall()
+        # Each connector leaves bar i at its top edge (the running total),
+        # which is where bar i + 1 starts.
+        for bar, nxt, line in zip(compiled.bars, compiled.bars[1:], compiled.lines):
+            (_, y0), (_, y1) = line.points
+            assert y0 == y1
+            assert y0 in (bar.py, pytest.approx(bar.py + bar.bar_height))
+            assert y0 in (nxt.py, pytest.approx(nxt.py + nxt.bar_height))
+
     def test_x_ticks_are_categories(self) -> None:
         compiled = self._compile_waterfall()
         labels = [t.label for t in compiled.x_ticks]
         assert labels == ["Revenue", "COGS", "Expenses", "Tax", "Profit"]
 
+    def test_scale_hint_running_totals(self) -> None:
+        layer = LayerSpec(geom="waterfall", x="category", y="amount")
+        hint = get_geom("waterfall").scale_hint(layer, WATERFALL_DATA)
+        assert hint.y_numeric == [0.0, 100.0, 60.0, 30.0, 20.0, 40.0]
+
     def test_y_range_covers_all_values(self) -> None:
         compiled = self._compile_waterfall()
         y_tick_values = [t.value for t in compiled.y_ticks]